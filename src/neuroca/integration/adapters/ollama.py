@@ -22,6 +22,7 @@ Usage:
     response = await adapter.generate(prompt="Explain neuroplasticity")
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -60,6 +61,8 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
                 - default_model: Default model to use
                 - request_timeout: Request timeout in seconds
                 - max_retries: Max number of retries for failed requests
+                - max_concurrent_embeddings: Max embedding requests in flight
+                  per generate_embedding call (default: 8)
                 - other parameters that will be passed to Ollama API
         """
         self._name = "ollama"
@@ -67,6 +70,7 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
         self._default_model = config.get("default_model", "llama3")
         self._request_timeout = config.get("request_timeout", 120)
         self._max_retries = config.get("max_retries", 3)
+        self._max_concurrent_embeddings = config.get("max_concurrent_embeddings", 8)
         self._config = config
         self._available_models = set()
         self._session = None
@@ -120,6 +124,9 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
         if not self._base_url.startswith(("http://", "https://")):
             raise ConfigurationError(f"Invalid base_url format: {self._base_url}") # Corrected exception type
         
+        if not isinstance(self._max_concurrent_embeddings, int) or self._max_concurrent_embeddings < 1:
+            raise ConfigurationError("max_concurrent_embeddings must be a positive integer")
+        
         return True
     
     async def _fetch_available_models(self) -> list[str]:
@@ -391,49 +398,35 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
         is_batch = isinstance(text, list)
         texts = text if is_batch else [text]
         
-        embeddings = []
-        total_tokens = 0
+        start_time = time.time()
         
         try:
-            for single_text in texts:
-                payload = {
-                    "model": model,
-                    "prompt": single_text
-                }
-                
-                async with self._session.post(
-                    f"{self._base_url}/api/embeddings",
-                    json=payload
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise OllamaError(f"Ollama API error ({response.status}): {error_text}")
-                    
-                    response_data = await response.json()
-                    embedding = response_data.get("embedding", [])
-                    embeddings.append(embedding)
-                    
-                    # Track token usage (estimated)
-                    total_tokens += len(single_text.split()) # Simple token estimation
-
-            embedding_content = embeddings[0] if not is_batch else embeddings
+            # Ollama embeds one prompt per call, so issue the calls concurrently
+            embeddings = await self._embed_many(texts, model)
+            
+            # Track token usage (estimated; Ollama doesn't report tokens for embeddings)
+            total_tokens = sum(len(single_text.split()) for single_text in texts)
+
+            embedding_content = embeddings[0] if not is_batch else list(embeddings)
             embedding_size = len(embeddings[0]) if embeddings else 0
 
             # Construct LLMResponse for embeddings
             return LLMResponse(
+                provider=self.name,
+                model=model,
                 content=embedding_content,
                 response_type=ResponseType.EMBEDDING,
-                model_name=model,
-                usage={
-                    "prompt_tokens": total_tokens, # Note: Ollama doesn't provide exact tokens for embeddings
-                    "total_tokens": total_tokens
-                },
+                usage=TokenUsage(
+                    prompt_tokens=total_tokens,
+                    total_tokens=total_tokens
+                ),
                 metadata={
                     "batch_size": len(texts),
                     "embedding_size": embedding_size,
                     "adapter": self.name
                 },
-                # raw_response could be the list of individual responses if needed
+                cost=0.0,
+                elapsed_time=time.time() - start_time
             )
             
         except aiohttp.ClientError as e:
@@ -445,6 +438,67 @@ class OllamaAdapter(BaseAdapter): # Corrected inheritance
                 raise OllamaError(f"Unexpected error during embedding: {str(e)}")
             raise
 
+    async def _embed_many(self, texts: list[str], model: str) -> list[list[float]]:
+        """
+        Request embeddings for several texts concurrently.
+        
+        At most max_concurrent_embeddings requests are in flight at once. If
+        any request fails, the remaining ones are cancelled before the error
+        is raised.
+        
+        Args:
+            texts: Texts to embed
+            model: Model to use
+        
+        Returns:
+            The embedding vectors, in the order of texts
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_embeddings)
+        
+        async def _bounded(single_text: str) -> list[float]:
+            async with semaphore:
+                return await self._embed_one(single_text, model)
+        
+        tasks = [asyncio.ensure_future(_bounded(single_text)) for single_text in texts]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Collect the cancelled tasks so their exceptions are retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _embed_one(self, text: str, model: str) -> list[float]:
+        """
+        Request the embedding for a single text.
+
+        Args:
+            text: Text to embed
+            model: Model to use
+
+        Returns:
+            The embedding vector returned by Ollama
+
+        Raises:
+            OllamaError: If the API returns a non-200 status
+        """
+        payload = {
+            "model": model,
+            "prompt": text
+        }
+        
+        async with self._session.post(
+            f"{self._base_url}/api/embeddings",
+            json=payload
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise OllamaError(f"Ollama API error ({response.status}): {error_text}")
+            
+            response_data = await response.json()
+            return response_data.get("embedding", [])
+
     async def generate_with_functions(
         self,
         messages: list[dict[str, str]],
@@ -31,6 +31,31 @@ except ImportError:
         TOKENIZER_TYPE = "simple"
         logger.warning("Neither tiktoken nor transformers is available. Using simple word-based tokenization.")
 
+# Prefer orjson for parsing JSON responses, falling back to json where it differs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers wider than 64 bits into floats instead of failing
+_LONG_DIGITS_RE = re.compile(r"\d{19,}")
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Parse JSON with orjson when available, otherwise with the standard library.
+    
+    Input orjson rejects but json accepts (NaN, Infinity) and input with
+    integers orjson would lose precision on are parsed by json.loads, so the
+    result always matches json.loads.
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 # Cache for tokenizers to avoid recreating them
 _tokenizers = {}
 
@@ -169,14 +194,14 @@ def parse_response(response: str, expected_format: str = "text") -> Any:
         json_str = match.group(1) if match else response
         
         try:
-            return json.loads(json_str)
+            return _json_loads(json_str)
         except json.JSONDecodeError:
             # Try to fix common JSON errors
             json_str = re.sub(r"'([^']*)':", r'"\1":', json_str)  # Replace single quotes with double quotes in keys
             json_str = re.sub(r",\s*}", "}", json_str)  # Remove trailing commas
             
             try:
-                return json.loads(json_str)
+                return _json_loads(json_str)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON response: {str(e)}")
                 raise ValueError(f"Response is not valid JSON: {json_str}")
@@ -185,7 +210,7 @@ def parse_response(response: str, expected_format: str = "text") -> Any:
         # Try to extract a list from the response
         if response.startswith("[") and response.endswith("]"):
             try:
-                return json.loads(response)
+                return _json_loads(response)
             except json.JSONDecodeError:
                 pass
                 
@@ -208,6 +233,10 @@ def parse_response(response: str, expected_format: str = "text") -> Any:
     return response
     
     
+# Characters stripped by sanitize_input; str.translate deletes them in a single C-level pass
+_INJECTION_CHARS_TABLE = str.maketrans("", "", "`\\|;<>&$")
+
+
 def sanitize_input(text: str, max_length: Optional[int] = None) -> str:
     """
     Sanitize input to remove sensitive or problematic content.
@@ -223,7 +252,7 @@ def sanitize_input(text: str, max_length: Optional[int] = None) -> str:
         return ""
         
     # Remove potential command injection patterns
-    text = re.sub(r"[`\\|;<>&$]", "", text)
+    text = text.translate(_INJECTION_CHARS_TABLE)
     
     # Truncate if needed
     if max_length and len(text) > max_length:
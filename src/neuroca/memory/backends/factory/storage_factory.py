@@ -6,6 +6,8 @@ The factory is responsible for creating the appropriate backend based on
 configuration settings and ensures only one instance of each backend is created.
 """
 
+import hashlib
+import json
 import logging
 from typing import Any, Dict, Optional, Type
 
@@ -111,6 +113,10 @@ class StorageBackendFactory:
                 instance_name += f"_{config['database']}"
             elif "host" in config and "port" in config:
                 instance_name += f"_{config['host']}_{config['port']}"
+            
+            # Identical configs share an instance; any other difference gets its own
+            if config:
+                instance_name += f"_{cls._config_digest(config)}"
         
         # Check if instance already exists
         if use_existing and instance_name in cls._instances:
@@ -126,6 +132,20 @@ class StorageBackendFactory:
         
         return backend
     
+    @staticmethod
+    def _config_digest(config: Dict[str, Any]) -> str:
+        """
+        Get a short, stable digest of a backend configuration.
+        
+        Args:
+            config: Backend-specific configuration
+            
+        Returns:
+            Hex digest that is equal for equal configurations
+        """
+        encoded = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:12]
+    
     @classmethod
     def register_backend(cls, backend_type: BackendType, backend_class: Type[BaseStorageBackend]) -> None:
         """
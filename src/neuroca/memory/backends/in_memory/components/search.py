@@ -139,25 +139,24 @@ class InMemorySearch:
         Returns:
             List of matching items
         """
+        # Lowercase the query once rather than per item and field
+        query = query.lower()
+        
         await self.storage.acquire_lock()
         try:
-            items_with_ids = [
-                {"_id": item_id, **item}
-                for item_id, item in self.storage.get_all_items().items()
-            ]
-            
-            # Filter items by text match in specified fields
+            # Filter items by text match in specified fields, stopping as soon
+            # as the limit is reached
             matching_items = []
-            for item in items_with_ids:
+            for item_id, stored_item in self.storage.get_all_items().items():
+                item = {"_id": item_id, **stored_item}
                 for field in fields:
                     value = self._get_field_value(item, field)
-                    if value is not None and isinstance(value, str) and query.lower() in value.lower():
+                    if value is not None and isinstance(value, str) and query in value.lower():
                         matching_items.append(item)
                         break
-            
-            # Apply limit if provided
-            if limit:
-                matching_items = matching_items[:limit]
+                
+                if limit and len(matching_items) >= limit:
+                    break
             
             return matching_items
         finally:
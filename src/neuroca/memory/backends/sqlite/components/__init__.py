@@ -5,6 +5,7 @@ This package contains the modular components of the SQLite storage backend:
 - connection.py: Database connection management
 - schema.py: Database schema definitions
 - crud.py: CRUD operations for memory items
+- serialization.py: JSON column and MemoryItem row conversion
 - search.py: Search functionality
 - batch.py: Batch operations
 - stats.py: Statistics and metrics
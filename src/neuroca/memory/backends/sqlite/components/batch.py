@@ -6,9 +6,9 @@ in the SQLite database, such as batch storing, retrieving, and deleting.
 """
 
 import logging
-import sqlite3
 from typing import List
 
+from neuroca.memory.backends.sqlite.components.serialization import dump_json
 from neuroca.memory.models.memory_item import MemoryItem
 
 logger = logging.getLogger(__name__)
@@ -22,21 +22,25 @@ class SQLiteBatch:
     memory items in a single transaction for improved performance.
     """
     
-    def __init__(self, connection: sqlite3.Connection, crud):
+    def __init__(self, connection_manager, crud):
         """
         Initialize the batch operations handler.
         
         Args:
-            connection: SQLite database connection
+            connection_manager: SQLiteConnection instance to manage database connections
             crud: SQLiteCRUD instance for single-item operations
         """
-        self.conn = connection
+        self.connection_manager = connection_manager
         self.crud = crud
     
     def batch_store(self, memory_items: List[MemoryItem]) -> List[str]:
         """
         Store multiple memory items in a single transaction.
         
+        Rows for each table are built up front and written with one
+        executemany per table, so the whole batch costs three statements
+        and one commit regardless of its size.
+        
         Args:
             memory_items: List of memory items to store
             
@@ -49,24 +53,57 @@ class SQLiteBatch:
                 memory_item.id = self.crud._generate_id()
         
         memory_ids = [item.id for item in memory_items]
+        if not memory_items:
+            return memory_ids
+        
+        item_rows = [self.crud._item_row(item) for item in memory_items]
+        metadata_rows = [
+            (item.id, dump_json(item.metadata)) for item in memory_items if item.metadata
+        ]
+        tag_rows = [
+            row
+            for item in memory_items if item.metadata
+            for row in self.crud._tag_rows(item.id, item.metadata)
+        ]
         
-        with self.conn:
+        # Get a connection for the current thread
+        conn = self.connection_manager.get_connection()
+        
+        with conn:
             # Begin transaction
-            self.conn.execute("BEGIN")
+            conn.execute("BEGIN")
             
             try:
-                for memory_item in memory_items:
-                    # Store the memory item
-                    self.crud._store_memory_without_transaction(memory_item)
+                conn.executemany(
+                    """
+                    INSERT INTO memory_items (id, content, summary, created_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    item_rows
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO memory_metadata (memory_id, metadata_json)
+                    VALUES (?, ?)
+                    """,
+                    metadata_rows
+                )
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO memory_tags (memory_id, tag)
+                    VALUES (?, ?)
+                    """,
+                    tag_rows
+                )
                 
                 # Commit the transaction
-                self.conn.execute("COMMIT")
+                conn.execute("COMMIT")
                 
                 logger.debug(f"Batch stored {len(memory_ids)} memories")
                 return memory_ids
             except Exception as e:
                 # Rollback the transaction on error
-                self.conn.execute("ROLLBACK")
+                conn.execute("ROLLBACK")
                 logger.error(f"Failed to batch store memories: {str(e)}")
                 raise
     
@@ -106,30 +143,31 @@ class SQLiteBatch:
         if not memory_ids:
             return 0
         
-        with self.conn:
+        id_rows = [(memory_id,) for memory_id in memory_ids]
+        
+        # Get a connection for the current thread
+        conn = self.connection_manager.get_connection()
+        
+        with conn:
             # Begin transaction
-            self.conn.execute("BEGIN")
+            conn.execute("BEGIN")
             
             try:
-                deleted_count = 0
-                
-                for memory_id in memory_ids:
-                    # Delete the memory item
-                    cursor = self.conn.execute(
-                        "DELETE FROM memory_items WHERE id = ?",
-                        (memory_id,)
-                    )
-                    
-                    deleted_count += cursor.rowcount
+                # Remove dependent rows explicitly; foreign key cascades are
+                # only active on connections that enabled them
+                conn.executemany("DELETE FROM memory_tags WHERE memory_id = ?", id_rows)
+                conn.executemany("DELETE FROM memory_metadata WHERE memory_id = ?", id_rows)
+                cursor = conn.executemany("DELETE FROM memory_items WHERE id = ?", id_rows)
+                deleted_count = cursor.rowcount
                 
                 # Commit the transaction
-                self.conn.execute("COMMIT")
+                conn.execute("COMMIT")
                 
                 logger.debug(f"Batch deleted {deleted_count} memories")
                 return deleted_count
             except Exception as e:
                 # Rollback the transaction on error
-                self.conn.execute("ROLLBACK")
+                conn.execute("ROLLBACK")
                 logger.error(f"Failed to batch delete memories: {str(e)}")
                 raise
     
@@ -146,9 +184,12 @@ class SQLiteBatch:
         if not memory_items:
             return 0
         
-        with self.conn:
+        # Get a connection for the current thread
+        conn = self.connection_manager.get_connection()
+        
+        with conn:
             # Begin transaction
-            self.conn.execute("BEGIN")
+            conn.execute("BEGIN")
             
             try:
                 updated_count = 0
@@ -159,7 +200,7 @@ class SQLiteBatch:
                         continue
                     
                     # Check if memory exists
-                    exists = self.conn.execute(
+                    exists = conn.execute(
                         "SELECT 1 FROM memory_items WHERE id = ?",
                         (memory_item.id,)
                     ).fetchone()
@@ -173,12 +214,12 @@ class SQLiteBatch:
                         updated_count += 1
                 
                 # Commit the transaction
-                self.conn.execute("COMMIT")
+                conn.execute("COMMIT")
                 
                 logger.debug(f"Batch updated {updated_count} memories")
                 return updated_count
             except Exception as e:
                 # Rollback the transaction on error
-                self.conn.execute("ROLLBACK")
+                conn.execute("ROLLBACK")
                 logger.error(f"Failed to batch update memories: {str(e)}")
                 raise
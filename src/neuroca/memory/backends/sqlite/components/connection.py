@@ -9,12 +9,17 @@ import logging
 import os
 import sqlite3
 import threading
-from typing import Any, Callable, Optional, TypeVar
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Prepared statements kept per connection; the stdlib default of 128 is easily
+# exhausted by the CRUD, batch and per-filter search statements combined
+STATEMENT_CACHE_SIZE = 256
+
 
 class SQLiteConnection:
     """
@@ -27,7 +32,9 @@ class SQLiteConnection:
     def __init__(
         self,
         db_path: str,
-        connection_timeout: float = 30.0
+        connection_timeout: float = 30.0,
+        pragmas: Optional[Dict[str, Any]] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize the SQLite connection manager.
@@ -35,12 +42,32 @@ class SQLiteConnection:
         Args:
             db_path: Path to the SQLite database file
             connection_timeout: Connection timeout in seconds
+            pragmas: PRAGMA settings applied to every new connection
+                (e.g. {"journal_mode": "WAL", "synchronous": "NORMAL"}).
+                foreign_keys is always enabled unless overridden here.
+            executor: Executor that runs database operations; each of its
+                threads holds one connection. Defaults to the event loop's
+                default executor.
         """
         self.db_path = db_path
         self.connection_timeout = connection_timeout
+        # foreign_keys is per-connection state, so every thread's connection
+        # needs it for the ON DELETE CASCADE clauses to take effect
+        self.pragmas = {"foreign_keys": "ON", **(pragmas or {})}
+        self.executor = executor
         self._lock = asyncio.Lock()
         self._thread_local = threading.local()
     
+    @property
+    def is_uri(self) -> bool:
+        """Whether db_path is a SQLite URI (``file:...``) rather than a plain path."""
+        return self.db_path.startswith("file:")
+    
+    @property
+    def is_memory(self) -> bool:
+        """Whether db_path refers to an in-memory database."""
+        return self.db_path == ":memory:" or (self.is_uri and "mode=memory" in self.db_path)
+    
     def _ensure_connection(self) -> None:
         """
         Ensure a database connection exists for the current thread.
@@ -50,20 +77,38 @@ class SQLiteConnection:
         # Check if we have a connection for this thread
         if not hasattr(self._thread_local, "conn") or self._thread_local.conn is None:
             # Ensure directory exists for file-based databases
-            if self.db_path != ":memory:" and os.path.dirname(self.db_path):
+            if not self.is_uri and not self.is_memory and os.path.dirname(self.db_path):
                 os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             
             # Create connection with desired settings
             self._thread_local.conn = sqlite3.connect(
                 self.db_path,
                 timeout=self.connection_timeout,
+                uri=self.is_uri,
+                cached_statements=STATEMENT_CACHE_SIZE,
                 isolation_level=None,  # autocommit mode
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
             )
             self._thread_local.conn.row_factory = sqlite3.Row
+            self._apply_pragmas(self._thread_local.conn)
             
             logger.debug(f"Created new SQLite connection to {self.db_path} for thread {threading.get_ident()}")
     
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply the configured PRAGMA settings to a new connection.
+        
+        journal_mode is skipped for in-memory databases, which only support
+        the MEMORY and OFF journal modes.
+        
+        Args:
+            conn: The connection to configure
+        """
+        for name, value in self.pragmas.items():
+            if name == "journal_mode" and self.is_memory:
+                continue
+            conn.execute(f"PRAGMA {name} = {value}")
+    
     async def execute_async(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """
         Execute a database operation asynchronously.
@@ -77,10 +122,10 @@ class SQLiteConnection:
             T: Result of the function
         """
         # Run the database operation in an executor
-        # Each executor gets its own thread and thus its own connection
-        loop = asyncio.get_event_loop()
+        # Each executor thread has its own connection
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,
+            self.executor,
             lambda: self._execute_with_connection(func, *args, **kwargs)
         )
     
@@ -5,18 +5,19 @@ This module provides a class for handling CRUD (Create, Read, Update, Delete)
 operations on memory items in the SQLite database.
 """
 
-import json
 import logging
 import sqlite3
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from pydantic import BaseModel
+
+from neuroca.memory.backends.sqlite.components.serialization import build_item, dump_json
 from neuroca.memory.models.memory_item import MemoryItem
 
 logger = logging.getLogger(__name__)
 
-
 class SQLiteCRUD:
     """
     Handles CRUD operations for memory items in SQLite database.
@@ -96,12 +97,7 @@ class SQLiteCRUD:
             INSERT INTO memory_items (id, content, summary, created_at)
             VALUES (?, ?, ?, ?)
             """,
-            (
-                memory_id,
-                memory_item.content,
-                memory_item.summary,
-                datetime.now()
-            )
+            self._item_row(memory_item)
         )
         
         # Store metadata if it exists
@@ -110,6 +106,37 @@ class SQLiteCRUD:
         
         return memory_id
     
+    def _item_row(self, memory_item: MemoryItem) -> Tuple[Any, ...]:
+        """
+        Build the memory_items row for a memory item.
+        
+        Args:
+            memory_item: The memory item to store
+            
+        Returns:
+            Tuple: (id, content_json, summary, created_at)
+        """
+        return (
+            memory_item.id,
+            dump_json(memory_item.content),
+            memory_item.summary,
+            datetime.now()
+        )
+    
+    def _tag_rows(self, memory_id: str, metadata: Any) -> List[Tuple[str, str]]:
+        """
+        Build the memory_tags rows for a memory item's metadata.
+        
+        Args:
+            memory_id: ID of the memory item
+            metadata: Metadata model or dict
+            
+        Returns:
+            List[Tuple[str, str]]: (memory_id, tag) pairs
+        """
+        tags = metadata.tags if isinstance(metadata, BaseModel) else metadata.get("tags")
+        return [(memory_id, tag) for tag in tags or ()]
+    
     def retrieve(self, memory_id: str) -> Optional[MemoryItem]:
         """
         Retrieve a memory item from the database by ID.
@@ -123,12 +150,13 @@ class SQLiteCRUD:
         # Get a connection for the current thread
         conn = self.connection_manager.get_connection()
         
-        # Get the memory item
+        # Get the memory item together with its metadata
         memory_row = conn.execute(
             """
-            SELECT id, content, summary, created_at, last_accessed, last_modified
-            FROM memory_items
-            WHERE id = ?
+            SELECT m.id, m.content, m.summary, mm.metadata_json
+            FROM memory_items m
+            LEFT JOIN memory_metadata mm ON mm.memory_id = m.id
+            WHERE m.id = ?
             """,
             (memory_id,)
         ).fetchone()
@@ -147,16 +175,8 @@ class SQLiteCRUD:
             (datetime.now(), memory_id)
         )
         
-        # Get metadata
-        metadata = self._retrieve_metadata(memory_id)
-        
         # Create the memory item
-        memory_item = MemoryItem(
-            id=memory_row[0],
-            content=memory_row[1],
-            summary=memory_row[2],
-            metadata=metadata
-        )
+        memory_item = build_item(*memory_row)
         
         logger.debug(f"Retrieved memory with ID: {memory_id}")
         return memory_item
@@ -236,7 +256,7 @@ class SQLiteCRUD:
             WHERE id = ?
             """,
             (
-                memory_item.content,
+                dump_json(memory_item.content),
                 memory_item.summary,
                 datetime.now(),
                 memory_id
@@ -273,8 +293,10 @@ class SQLiteCRUD:
                 logger.warning(f"Memory with ID {memory_id} not found for deletion")
                 return False
             
-            # Delete the memory item
-            # Foreign key constraints will handle related deletions
+            # Remove dependent rows explicitly rather than relying on
+            # cascades, which need foreign_keys enabled on this connection
+            conn.execute("DELETE FROM memory_tags WHERE memory_id = ?", (memory_id,))
+            conn.execute("DELETE FROM memory_metadata WHERE memory_id = ?", (memory_id,))
             conn.execute(
                 "DELETE FROM memory_items WHERE id = ?",
                 (memory_id,)
@@ -294,7 +316,7 @@ class SQLiteCRUD:
         # Get a connection for the current thread
         conn = self.connection_manager.get_connection()
         
-        metadata_json = json.dumps(metadata)
+        metadata_json = dump_json(metadata)
         
         conn.execute(
             """
@@ -305,15 +327,13 @@ class SQLiteCRUD:
         )
         
         # Store tags if they exist
-        if metadata.get("tags"):
-            for tag in metadata["tags"]:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO memory_tags (memory_id, tag)
-                    VALUES (?, ?)
-                    """,
-                    (memory_id, tag)
-                )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO memory_tags (memory_id, tag)
+            VALUES (?, ?)
+            """,
+            self._tag_rows(memory_id, metadata)
+        )
     
     def _update_metadata(self, memory_id: str, metadata: Dict) -> None:
         """
@@ -326,7 +346,7 @@ class SQLiteCRUD:
         # Get a connection for the current thread
         conn = self.connection_manager.get_connection()
         
-        metadata_json = json.dumps(metadata)
+        metadata_json = dump_json(metadata)
         
         # Check if metadata exists
         metadata_exists = conn.execute(
@@ -353,7 +373,8 @@ class SQLiteCRUD:
             )
         
         # Update tags
-        if metadata.get("tags"):
+        tag_rows = self._tag_rows(memory_id, metadata)
+        if tag_rows:
             # Delete existing tags
             conn.execute(
                 "DELETE FROM memory_tags WHERE memory_id = ?",
@@ -361,41 +382,13 @@ class SQLiteCRUD:
             )
             
             # Add new tags
-            for tag in metadata["tags"]:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO memory_tags (memory_id, tag)
-                    VALUES (?, ?)
-                    """,
-                    (memory_id, tag)
-                )
-    
-    def _retrieve_metadata(self, memory_id: str) -> Dict:
-        """
-        Retrieve metadata for a memory item.
-        
-        Args:
-            memory_id: ID of the memory item
-            
-        Returns:
-            Dict: Memory metadata or empty dict if not found
-        """
-        # Get a connection for the current thread
-        conn = self.connection_manager.get_connection()
-        
-        metadata_row = conn.execute(
-            """
-            SELECT metadata_json
-            FROM memory_metadata
-            WHERE memory_id = ?
-            """,
-            (memory_id,)
-        ).fetchone()
-        
-        if metadata_row:
-            return json.loads(metadata_row[0])
-        
-        return {}
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO memory_tags (memory_id, tag)
+                VALUES (?, ?)
+                """,
+                tag_rows
+            )
     
     def _generate_id(self) -> str:
         """
@@ -41,8 +41,7 @@ class SQLiteSchema:
         conn = self.connection_manager.get_connection()
         
         with conn:
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
+            # foreign_keys is applied per connection by SQLiteConnection
             
             # Create the memory_items table
             conn.execute("""
@@ -90,15 +89,10 @@ class SQLiteSchema:
         conn = self.connection_manager.get_connection()
         
         with conn:
-            # Index on content for full-text search
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_memory_content ON memory_items(content)"
-            )
-            
-            # Index on summary for search
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_memory_summary ON memory_items(summary)"
-            )
+            # Text search uses LIKE '%...%', which can never use a b-tree index;
+            # indexing content and summary only duplicated every row's text
+            conn.execute("DROP INDEX IF EXISTS idx_memory_content")
+            conn.execute("DROP INDEX IF EXISTS idx_memory_summary")
             
             # Index on tags for filtering
             conn.execute(
@@ -117,6 +111,36 @@ class SQLiteSchema:
             
             logger.debug("SQLite database indices created successfully")
     
+    def clear_tables(self) -> int:
+        """
+        Delete every row from the memory tables in a single transaction.
+        
+        The schema, indices and connection settings are left in place, so
+        this is much cheaper than recreating the database.
+        
+        Returns:
+            int: Number of memory items deleted
+        """
+        # Get the connection for the current thread
+        conn = self.connection_manager.get_connection()
+        
+        with conn:
+            conn.execute("BEGIN")
+            
+            try:
+                # Children first, so this works without foreign key cascades
+                conn.execute("DELETE FROM memory_tags")
+                conn.execute("DELETE FROM memory_metadata")
+                deleted = conn.execute("DELETE FROM memory_items").rowcount
+                
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        
+        logger.debug(f"Cleared {deleted} memory items from SQLite tables")
+        return deleted
+    
     def upgrade_schema(self, current_version: int, target_version: int) -> None:
         """
         Upgrade the database schema from one version to another.
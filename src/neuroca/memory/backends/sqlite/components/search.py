@@ -5,16 +5,21 @@ This module provides a class for handling search operations on memory items
 in the SQLite database, including filtering, sorting, and pagination.
 """
 
-import json
 import logging
 import sqlite3
 from typing import List, Optional, Tuple
 
-from neuroca.memory.models.memory_item import MemoryItem
+from neuroca.memory.backends.sqlite.components.serialization import build_item
 from neuroca.memory.models.search import MemorySearchOptions as SearchFilter, MemorySearchResult as SearchResult, MemorySearchResults as SearchResults
 
 logger = logging.getLogger(__name__)
 
+# A field of the JSON content column; legacy plain-text content is matched as is
+_CONTENT_FIELD = (
+    "(CASE WHEN json_valid(content) THEN json_extract(content, '$.{field}') "
+    "ELSE content END)"
+)
+
 
 class SQLiteSearch:
     """
@@ -24,14 +29,16 @@ class SQLiteSearch:
     based on content, tags, metadata, and other criteria.
     """
     
-    def __init__(self, connection_manager):
+    def __init__(self, connection_manager, tier_name: str = "generic"):
         """
         Initialize the search operations handler.
         
         Args:
             connection_manager: SQLiteConnection instance to manage database connections
+            tier_name: Name of the memory tier reported on each search result
         """
         self.connection_manager = connection_manager
+        self.tier_name = tier_name
     
     def search(
         self,
@@ -66,16 +73,16 @@ class SQLiteSearch:
         total_count = conn.execute(count_query, count_params).fetchone()[0]
         
         # Convert rows to memory items
-        results = self._convert_rows_to_results(rows)
+        results = self._convert_rows_to_results(rows, offset)
         
         # Create search results
+        # Pass the original filter options back in the results object
+        search_options = filter if filter else SearchFilter(query=query, limit=limit, offset=offset)
         search_results = SearchResults(
             query=query,
             results=results,
-            total_results=total_count,
-            page=offset // limit + 1 if limit > 0 else 1,
-            page_size=limit,
-            total_pages=(total_count + limit - 1) // limit if limit > 0 else 1
+            total_count=total_count,
+            options=search_options
         )
         
         logger.debug(f"Search for '{query}' returned {len(results)} results")
@@ -122,34 +129,14 @@ class SQLiteSearch:
         Returns:
             Tuple[str, List]: SQL query string and parameters
         """
-        # Base query
-        sql_query = """
-            SELECT DISTINCT m.id, m.content, m.summary, m.created_at,
+        sql_query, params = self._build_base_query(
+            query,
+            filter,
+            """
+            SELECT m.id, m.content, m.summary, m.created_at,
                    m.last_accessed, m.last_modified, mm.metadata_json
-            FROM memory_items m
-            LEFT JOIN memory_metadata mm ON m.id = mm.memory_id
-            LEFT JOIN memory_tags mt ON m.id = mt.memory_id
-        """
-        
-        # Add WHERE clause if needed
-        where_clauses = []
-        params = []
-        
-        # Add search query if provided
-        if query:
-            where_clauses.append("""
-                (m.content LIKE ? OR m.summary LIKE ? OR mt.tag LIKE ?)
-            """)
-            search_term = f"%{query}%"
-            params.extend([search_term, search_term, search_term])
-        
-        # Add filters if provided
-        if filter:
-            self._add_filter_clauses(filter, where_clauses, params)
-        
-        # Add WHERE clause if any conditions are present
-        if where_clauses:
-            sql_query += " WHERE " + " AND ".join(where_clauses)
+            """
+        )
         
         # Add order by
         sql_query += " ORDER BY m.created_at DESC"
@@ -175,35 +162,69 @@ class SQLiteSearch:
         Returns:
             Tuple[str, List]: SQL query string and parameters
         """
-        # Base query
-        count_query = """
-            SELECT COUNT(DISTINCT m.id)
-            FROM memory_items m
-            LEFT JOIN memory_metadata mm ON m.id = mm.memory_id
-            LEFT JOIN memory_tags mt ON m.id = mt.memory_id
+        return self._build_base_query(query, filter, "SELECT COUNT(*)")
+    
+    def _build_base_query(
+        self,
+        query: str,
+        filter: Optional[SearchFilter],
+        select_clause: str
+    ) -> Tuple[str, List]:
         """
+        Build the FROM/WHERE part shared by the search and count queries.
         
-        # Add WHERE clause if needed
-        where_clauses = []
+        Text matches are materialized in a CTE first: ids whose content text,
+        content summary or summary column match, UNION ids with a matching tag.
+        Content is matched on its extracted fields rather than the stored JSON,
+        so key names and escaping never match. Filters then run only
+        over those rows, and because the CTE yields each id once there is no
+        memory_tags join fanning rows out and no DISTINCT to undo it.
+        
+        Args:
+            query: Search query string
+            filter: Optional filter conditions
+            select_clause: SELECT list to prepend
+            
+        Returns:
+            Tuple[str, List]: SQL query string and parameters
+        """
         params = []
         
-        # Add search query if provided
         if query:
-            where_clauses.append("""
-                (m.content LIKE ? OR m.summary LIKE ? OR mt.tag LIKE ?)
-            """)
             search_term = f"%{query}%"
-            params.extend([search_term, search_term, search_term])
+            sql_query = f"""
+                WITH matches AS (
+                    SELECT id FROM memory_items
+                    WHERE {_CONTENT_FIELD.format(field="text")} LIKE ?
+                       OR {_CONTENT_FIELD.format(field="summary")} LIKE ?
+                       OR summary LIKE ?
+                    UNION
+                    SELECT memory_id FROM memory_tags
+                    WHERE tag LIKE ?
+                )
+                {select_clause}
+                FROM matches
+                JOIN memory_items m ON m.id = matches.id
+                LEFT JOIN memory_metadata mm ON m.id = mm.memory_id
+            """
+            params.extend([search_term, search_term, search_term, search_term])
+        else:
+            sql_query = f"""
+                {select_clause}
+                FROM memory_items m
+                LEFT JOIN memory_metadata mm ON m.id = mm.memory_id
+            """
         
         # Add filters if provided
+        where_clauses = []
         if filter:
             self._add_filter_clauses(filter, where_clauses, params)
         
         # Add WHERE clause if any conditions are present
         if where_clauses:
-            count_query += " WHERE " + " AND ".join(where_clauses)
+            sql_query += " WHERE " + " AND ".join(where_clauses)
         
-        return count_query, params
+        return sql_query, params
     
     def _add_filter_clauses(
         self,
@@ -225,17 +246,20 @@ class SQLiteSearch:
             """)
             params.append(filter.min_importance)
         
-        if filter.max_importance is not None:
+        max_importance = getattr(filter, "max_importance", None)
+        if max_importance is not None:
             where_clauses.append("""
                 (json_extract(mm.metadata_json, '$.importance') <= ?)
             """)
-            params.append(filter.max_importance)
+            params.append(max_importance)
         
         if filter.status:
-            where_clauses.append("""
-                (json_extract(mm.metadata_json, '$.status') = ?)
+            statuses = [filter.status] if isinstance(filter.status, str) else list(filter.status)
+            placeholders = ", ".join(["?"] * len(statuses))
+            where_clauses.append(f"""
+                (json_extract(mm.metadata_json, '$.status') IN ({placeholders}))
             """)
-            params.append(filter.status)
+            params.extend(statuses)
         
         if filter.tags:
             placeholders = ", ".join(["?"] * len(filter.tags))
@@ -266,35 +290,31 @@ class SQLiteSearch:
             where_clauses.append("m.last_accessed <= ?")
             params.append(filter.accessed_before)
     
-    def _convert_rows_to_results(self, rows: List[sqlite3.Row]) -> List[SearchResult]:
+    def _convert_rows_to_results(self, rows: List[sqlite3.Row], offset: int = 0) -> List[SearchResult]:
         """
         Convert SQL rows to search results.
         
         Args:
             rows: SQL result rows
+            offset: Number of results skipped before these rows, for ranking
             
         Returns:
             List[SearchResult]: List of search results
         """
         results = []
         
-        for row in rows:
-            metadata = {}
-            if row[6]:  # metadata_json
-                metadata = json.loads(row[6])
+        for rank, row in enumerate(rows, start=offset + 1):
+            # Columns: id, content, summary, ..., metadata_json
+            memory_item = build_item(row[0], row[1], row[2], row[6])
             
-            memory_item = MemoryItem(
-                id=row[0],
-                content=row[1],
-                summary=row[2],
-                metadata=metadata
-            )
-            
-            # For simplicity, use a constant score
+            # For simplicity, use a constant relevance
             # In a real implementation, you might want to calculate relevance scores
-            score = 1.0
-            
-            results.append(SearchResult(memory=memory_item, score=score))
+            results.append(SearchResult(
+                memory=memory_item,
+                relevance=1.0,
+                tier=self.tier_name,
+                rank=rank
+            ))
         
         return results
         
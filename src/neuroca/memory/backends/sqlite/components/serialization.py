@@ -0,0 +1,71 @@
+"""
+SQLite Serialization Component
+
+This module provides the helpers shared by the SQLite components for writing
+memory content and metadata to their JSON columns and for rebuilding
+MemoryItem instances from stored rows.
+"""
+
+import json
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from neuroca.memory.models.memory_item import MemoryContent, MemoryItem, MemoryMetadata
+
+# Prefer orjson for the JSON columns; columns stay TEXT so json_extract keeps working
+try:
+    import orjson
+
+    def _dump_plain_json(value: Any) -> str:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    load_json = orjson.loads
+except ImportError:
+    def _dump_plain_json(value: Any) -> str:
+        return json.dumps(value, default=str)
+
+    load_json = json.loads
+
+
+def dump_json(value: Any) -> str:
+    """Serialize content or metadata (a Pydantic model or plain data) to JSON."""
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return _dump_plain_json(value)
+
+
+def load_content(raw: Optional[str]) -> Any:
+    """Deserialize a content column written by dump_json; legacy plain text is wrapped as text content."""
+    if not raw:
+        return {}
+    try:
+        return load_json(raw)
+    except (TypeError, ValueError):
+        return {"text": raw}
+
+
+def build_item(
+    memory_id: str,
+    content_raw: Optional[str],
+    summary: Optional[str],
+    metadata_raw: Optional[str]
+) -> MemoryItem:
+    """
+    Hydrate a MemoryItem from its stored columns.
+    
+    Columns written by dump_json are parsed straight into their models with
+    model_validate_json, skipping the intermediate dicts; legacy rows fall back
+    to the dict path.
+    """
+    try:
+        content = MemoryContent.model_validate_json(content_raw) if content_raw else {}
+    except ValueError:
+        content = load_content(content_raw)
+    
+    try:
+        metadata = MemoryMetadata.model_validate_json(metadata_raw) if metadata_raw else {}
+    except ValueError:
+        metadata = load_json(metadata_raw)
+    
+    return MemoryItem(id=memory_id, content=content, summary=summary, metadata=metadata)
@@ -8,6 +8,7 @@ to implement the BaseStorageBackend interface for the memory system.
 import asyncio
 import logging
 import uuid
+from concurrent.futures import Executor
 from typing import Any, Dict, List, Optional, Union
 
 from neuroca.memory.backends.base import BaseStorageBackend
@@ -114,16 +115,11 @@ class SQLiteBackend(BaseStorageBackend):
         except Exception as e:
             raise StorageOperationError(f"Failed to count items: {str(e)}") from e
 
-    async def _clear_all_items(self) -> int:
+    async def _clear_all_items(self) -> bool:
         """Clear all items from storage."""
         try:
-            # Use connection to execute a delete all query
-            def _clear_all():
-                cursor = self.connection.get_connection().cursor()
-                cursor.execute("DELETE FROM memories")
-                return cursor.rowcount
-            
-            return await self.connection.execute_async(_clear_all)
+            await self.connection.execute_async(self.schema.clear_tables)
+            return True
         except Exception as e:
             raise StorageOperationError(f"Failed to clear all items: {str(e)}") from e
 
@@ -158,6 +154,7 @@ class SQLiteBackend(BaseStorageBackend):
         db_path: Optional[str] = None,
         tier_name: str = "generic",
         connection_timeout: float = 30.0,
+        executor: Optional[Executor] = None,
         **kwargs
     ):
         """
@@ -169,6 +166,8 @@ class SQLiteBackend(BaseStorageBackend):
                 in the system's temporary directory.
             tier_name: Name of the memory tier using this backend (for filename)
             connection_timeout: Connection timeout in seconds
+            executor: Optional executor for database operations (owned by the
+                caller); defaults to the event loop's default executor
             **kwargs: Additional configuration options
         """
         super().__init__(config)
@@ -196,7 +195,9 @@ class SQLiteBackend(BaseStorageBackend):
                 },
                 "performance": {
                     "journal_mode": "WAL",
-                    "synchronous": "NORMAL"
+                    "synchronous": "NORMAL",
+                    "temp_store": "MEMORY",
+                    "cache_size": -64000  # 64 MiB page cache
                 },
                 "schema": {
                     "auto_migrate": True,
@@ -219,7 +220,11 @@ class SQLiteBackend(BaseStorageBackend):
             
         # Set up path and create components
         self._setup_path(db_path, tier_name, **kwargs)
-        self._create_components(self.config["sqlite"]["connection"]["timeout_seconds"])
+        self._create_components(
+            self.config["sqlite"]["connection"]["timeout_seconds"],
+            self.config["sqlite"]["performance"],
+            executor
+        )
 
     def _deep_update(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
         """
@@ -251,14 +256,20 @@ class SQLiteBackend(BaseStorageBackend):
         """
         import os
         
-        if db_path and db_path != ":memory:":
+        if db_path and db_path.startswith("file:"):
+            # SQLite URI (e.g. a shared-cache in-memory database); used as-is
+            self.db_path = db_path
+        elif db_path and db_path != ":memory:":
             self.db_path = db_path
             # Ensure directory exists if a file path is given
             db_dir = os.path.dirname(self.db_path)
             if db_dir:
                  os.makedirs(db_dir, exist_ok=True)
         elif db_path == ":memory:":
-             self.db_path = ":memory:"
+            # Each executor thread opens its own connection, and a plain :memory:
+            # database is private to its connection, so use a named shared-cache
+            # in-memory database that every thread of this backend can see
+            self.db_path = f"file:neuroca_{tier_name}_{uuid.uuid4().hex}?mode=memory&cache=shared"
         else:
             # Use default path in data directory if db_path is None
             data_dir = kwargs.get('data_dir', os.path.join(os.getcwd(), 'data', 'memory'))
@@ -268,17 +279,26 @@ class SQLiteBackend(BaseStorageBackend):
         # Store tier name for reference
         self.tier_name = tier_name
     
-    def _create_components(self, connection_timeout: float) -> None:
+    def _create_components(
+        self,
+        connection_timeout: float,
+        pragmas: Optional[Dict[str, Any]] = None,
+        executor: Optional[Executor] = None
+    ) -> None:
         """
         Create the component instances.
         
         Args:
             connection_timeout: Connection timeout in seconds
+            pragmas: PRAGMA settings applied to every connection
+            executor: Optional executor for database operations
         """
         # Create the connection component
         self.connection = SQLiteConnection(
             db_path=self.db_path,
-            connection_timeout=connection_timeout
+            connection_timeout=connection_timeout,
+            pragmas=pragmas,
+            executor=executor
         )
         
         # Get the raw SQLite connection for other components
@@ -290,7 +310,7 @@ class SQLiteBackend(BaseStorageBackend):
         # These will be properly initialized in the initialize method
         self.schema = None
         self.crud = None
-        self.search = None
+        self.searcher = None
         self.batch = None
         self.stats = None
     
@@ -311,7 +331,8 @@ class SQLiteBackend(BaseStorageBackend):
             
             # Create other components using the connection manager
             self.crud = SQLiteCRUD(self.connection)
-            self.search = SQLiteSearch(self.connection)
+            # Not self.search, which would shadow the search() method
+            self.searcher = SQLiteSearch(self.connection, self.tier_name)
             self.stats = SQLiteStats(self.connection, self.db_path)
             
             # Create batch component last as it depends on crud
@@ -519,7 +540,7 @@ class SQLiteBackend(BaseStorageBackend):
         try:
             # Delegate to the Search component
             results = await self.connection.execute_async(
-                self.search.search,
+                self.searcher.search,
                 query, filter, limit, offset
             )
             
@@ -545,7 +566,7 @@ class SQLiteBackend(BaseStorageBackend):
         try:
             # Delegate to the Search component
             count = await self.connection.execute_async(
-                self.search.count,
+                self.searcher.count,
                 filter
             )
             
@@ -555,6 +576,26 @@ class SQLiteBackend(BaseStorageBackend):
             logger.error(error_msg, exc_info=True)
             raise StorageOperationError(error_msg) from e
     
+    async def clear(self) -> bool:
+        """
+        Clear all items from the SQLite database, keeping the schema.
+        
+        Returns:
+            bool: True if the operation was successful
+            
+        Raises:
+            StorageOperationError: If the clear operation fails
+        """
+        try:
+            # Delegate to the Schema component; self.stats is the SQLite
+            # stats component, not the base class counter clear() updates
+            await self.connection.execute_async(self.schema.clear_tables)
+            return True
+        except Exception as e:
+            error_msg = f"Failed to clear storage: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise StorageOperationError(error_msg) from e
+    
     async def get_stats(self) -> StorageStats:
         """
         Get statistics about the SQLite storage.
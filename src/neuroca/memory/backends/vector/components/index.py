@@ -118,9 +118,10 @@ class VectorIndex:
         """
         Rebuild the search index.
         
-        This creates a NumPy array of all vectors for efficient similarity
-        search operations. The index is only rebuilt when needed, as indicated
-        by the _dirty flag.
+        This creates a float32 NumPy array of all vectors for efficient
+        similarity search operations. Rows are normalized here, once, so a
+        search only needs a single matrix-vector product for cosine similarity.
+        The index is only rebuilt when needed, as indicated by the _dirty flag.
         """
         if not self.entries:
             self.vectors = None
@@ -130,7 +131,10 @@ class VectorIndex:
             return
             
         self.ids = list(self.entries.keys())
-        self.vectors = np.array([self.entries[id].vector for id in self.ids])
+        vectors = np.array([self.entries[id].vector for id in self.ids], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0  # Leave zero vectors as zeros instead of NaNs
+        self.vectors = vectors / norms
         self._dirty = False
         logger.debug(f"Rebuilt vector index with {len(self.ids)} entries")
     
@@ -167,25 +171,30 @@ class VectorIndex:
             return []
         
         # Convert query to numpy array
-        query_array = np.array(query_vector)
+        query_array = np.asarray(query_vector, dtype=np.float32)
         
-        # Compute cosine similarity
-        # First normalize vectors for cosine similarity
-        norm_query = query_array / np.linalg.norm(query_array)
-        norm_vectors = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
-        similarities = np.dot(norm_vectors, norm_query)
+        # Compute cosine similarity against the pre-normalized index
+        query_norm = np.linalg.norm(query_array)
+        if query_norm > 0:
+            query_array = query_array / query_norm
+        similarities = self.vectors @ query_array
         
-        # Sort by similarity
-        indices = np.argsort(similarities)[::-1]  # Descending order
+        # Sort by similarity, descending. Without a filter only the top k can
+        # be returned, so partition those out instead of sorting everything.
+        if filter_fn is None and k < len(similarities):
+            indices = np.argpartition(-similarities, k - 1)[:k]
+            indices = indices[np.argsort(-similarities[indices])]
+        else:
+            indices = np.argsort(-similarities)
         
         # Filter results if filter_fn is provided
         results = []
         for idx in indices:
             similarity = float(similarities[idx])
             
-            # Skip results below threshold
+            # Results are sorted, so everything after this is below threshold too
             if similarity < similarity_threshold:
-                continue
+                break
             
             entry_id = self.ids[idx]
             entry = self.entries[entry_id]
@@ -11,6 +11,8 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from neuroca.memory.backends.vector.components.models import VectorEntry
 from neuroca.memory.backends.vector.components.index import VectorIndex
 from neuroca.memory.exceptions import StorageBackendError, StorageInitializationError
@@ -50,6 +52,13 @@ class VectorStorage:
         
         logger.debug(f"Initialized vector storage with {'persistence' if index_path else 'no persistence'}")
     
+    @property
+    def vectors_path(self) -> Optional[str]:
+        """Path of the float32 .npy file holding the vectors next to the index file."""
+        if not self.index_path:
+            return None
+        return os.path.splitext(self.index_path)[0] + ".npy"
+    
     async def initialize(self) -> None:
         """
         Initialize the vector storage.
@@ -96,8 +105,23 @@ class VectorStorage:
                 # Clear existing index
                 self.index.clear()
                 
-                # Load entries
+                # Load entries; vectors live in the .npy file unless this is
+                # an older index that stored them inline in the JSON
                 entries_data = data.get("entries", [])
+                if data.get("vectors_file"):
+                    vectors_path = os.path.join(os.path.dirname(self.index_path), data["vectors_file"])
+                    # Read in full: entries hold their vectors as lists and the
+                    # index builds its own normalized matrix, so a memmap would
+                    # be copied immediately. The gain over inline JSON vectors
+                    # is skipping float parsing, not lazy loading.
+                    vectors = np.load(vectors_path)
+                    if len(vectors) != len(entries_data):
+                        raise ValueError(
+                            f"{vectors_path} holds {len(vectors)} vectors for {len(entries_data)} entries"
+                        )
+                    for entry_data, vector in zip(entries_data, vectors.tolist()):
+                        entry_data["vector"] = vector
+                
                 entries = []
                 for entry_data in entries_data:
                     entry = VectorEntry.from_dict(entry_data)
@@ -137,15 +161,37 @@ class VectorStorage:
                 # Create directory if it doesn't exist
                 os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
                 
+                # Vectors go to a binary float32 array; the JSON keeps ids and metadata
+                entries = self.index.get_entries()
+                vectors = np.array(
+                    [entry.vector for entry in entries], dtype=np.float32
+                ).reshape(len(entries), self.index.dimension)
+                
                 # Prepare data for serialization
                 data = {
-                    "entries": [entry.to_dict() for entry in self.index.get_entries()],
+                    "entries": [
+                        {"id": entry.id, "metadata": entry.metadata} for entry in entries
+                    ],
+                    "vectors_file": os.path.basename(self.vectors_path),
                     "memory_metadata": self._memory_metadata
                 }
                 
-                # Write to file
-                with open(self.index_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Write both files aside first so a failure leaves the saved
+                # pair untouched, then move them into place with the JSON last
+                vectors_tmp = f"{self.vectors_path}.tmp"
+                index_tmp = f"{self.index_path}.tmp"
+                try:
+                    with open(vectors_tmp, 'wb') as f:
+                        np.save(f, vectors)
+                    with open(index_tmp, 'w') as f:
+                        json.dump(data, f)
+                    
+                    os.replace(vectors_tmp, self.vectors_path)
+                    os.replace(index_tmp, self.index_path)
+                finally:
+                    for tmp_path in (vectors_tmp, index_tmp):
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
                 
                 logger.debug(f"Saved vector index to {self.index_path} with {self.index.count()} entries")
                 return True
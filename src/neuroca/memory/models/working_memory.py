@@ -330,9 +330,10 @@ class WorkingMemoryBuffer(BaseModel):
         if not self.items:
             return
         
-        # Find the least relevant item
-        least_relevant = min(self.items, key=lambda x: x.relevance)
+        # Find the least relevant item by position, so removing it does not
+        # compare it field-by-field against every item before it
+        index = min(range(len(self.items)), key=lambda i: self.items[i].relevance)
         
         # Remove it
-        self.items.remove(least_relevant)
+        least_relevant = self.items.pop(index)
         self.item_ids.remove(least_relevant.memory_id)
@@ -34,7 +34,9 @@ class LTMLifecycle:
         self._tier_name = tier_name
         self._maintenance_task = None
         self._category_map: Dict[str, Set[str]] = {}  # category -> set of memory_ids
+        self._memory_categories: Dict[str, Set[str]] = {}  # memory_id -> set of categories
         self._relationship_map: Dict[str, Dict[str, float]] = {}  # memory_id -> {related_id: strength}
+        self._reverse_relationship_map: Dict[str, Set[str]] = {}  # related_id -> set of memory_ids
         self._backend = None
         self._maintenance_func = None
         self._maintenance_interval = 86400  # Default: 24 hours
@@ -119,8 +121,9 @@ class LTMLifecycle:
         """
         logger.debug("Loading category map for LTM tier")
         
-        # Clear current map
+        # Clear current maps
         self._category_map = {}
+        self._memory_categories = {}
         
         try:
             # Query all memories with categories
@@ -136,10 +139,7 @@ class LTMLifecycle:
                     if "categories" in tags and memory_id:
                         categories = tags["categories"]
                         if isinstance(categories, list):
-                            for category in categories:
-                                if category not in self._category_map:
-                                    self._category_map[category] = set()
-                                self._category_map[category].add(memory_id)
+                            self.update_category(memory_id, categories)
                 except Exception as e:
                     logger.error(f"Error loading category for memory: {str(e)}")
             
@@ -153,8 +153,9 @@ class LTMLifecycle:
         """
         logger.debug("Loading relationship map for LTM tier")
         
-        # Clear current map
+        # Clear current maps
         self._relationship_map = {}
+        self._reverse_relationship_map = {}
         
         try:
             # Query all memories with relationships
@@ -171,6 +172,8 @@ class LTMLifecycle:
                         relationships = tags["relationships"]
                         if isinstance(relationships, dict):
                             self._relationship_map[memory_id] = relationships
+                            for related_id in relationships:
+                                self._reverse_relationship_map.setdefault(related_id, set()).add(memory_id)
                 except Exception as e:
                     logger.error(f"Error loading relationships for memory: {str(e)}")
             
@@ -206,16 +209,33 @@ class LTMLifecycle:
             memory_id: The ID of the memory
             categories: List of categories
         """
-        # Remove memory from any existing categories
-        for category, memory_ids in self._category_map.items():
-            if memory_id in memory_ids:
-                memory_ids.remove(memory_id)
+        # Remove memory from its existing categories
+        for category in self._memory_categories.pop(memory_id, ()):
+            self._category_map[category].discard(memory_id)
         
         # Add memory to new categories
         for category in categories:
             if category not in self._category_map:
                 self._category_map[category] = set()
             self._category_map[category].add(memory_id)
+        
+        if categories:
+            self._memory_categories[memory_id] = set(categories)
+    
+    def get_related_ids(self, memory_id: str) -> List[str]:
+        """
+        Get the IDs of memories directly related to a memory.
+        
+        Unlike get_relationship_map, this does not copy the whole map, so it
+        is cheap enough to call once per node during graph traversals.
+        
+        Args:
+            memory_id: The ID of the memory
+            
+        Returns:
+            List of related memory IDs
+        """
+        return list(self._relationship_map.get(memory_id, ()))
     
     def update_relationship(self, memory_id: str, related_id: str, strength: float) -> None:
         """
@@ -230,24 +250,46 @@ class LTMLifecycle:
             self._relationship_map[memory_id] = {}
         
         self._relationship_map[memory_id][related_id] = strength
+        self._reverse_relationship_map.setdefault(related_id, set()).add(memory_id)
+    
+    def remove_relationship(self, memory_id: str, related_id: str) -> None:
+        """
+        Remove the relationship from one memory to another.
+        
+        Args:
+            memory_id: The ID of the memory
+            related_id: The ID of the related memory
+        """
+        relationships = self._relationship_map.get(memory_id)
+        if relationships is not None:
+            relationships.pop(related_id, None)
+        
+        sources = self._reverse_relationship_map.get(related_id)
+        if sources is not None:
+            sources.discard(memory_id)
     
     def remove_memory(self, memory_id: str) -> None:
         """
         Remove a memory from all category and relationship maps.
         
+        The reverse indexes mean only the memory's own categories and
+        relationships are touched, not every entry in the maps.
+        
         Args:
             memory_id: The ID of the memory
         """
         # Remove from categories
-        for category, memory_ids in self._category_map.items():
-            if memory_id in memory_ids:
-                memory_ids.remove(memory_id)
+        for category in self._memory_categories.pop(memory_id, ()):
+            self._category_map[category].discard(memory_id)
         
         # Remove from relationships
-        if memory_id in self._relationship_map:
-            del self._relationship_map[memory_id]
+        for related_id in self._relationship_map.pop(memory_id, {}):
+            sources = self._reverse_relationship_map.get(related_id)
+            if sources is not None:
+                sources.discard(memory_id)
         
         # Remove from related memories
-        for related_id, relationships in self._relationship_map.items():
-            if memory_id in relationships:
-                del relationships[memory_id]
+        for source_id in self._reverse_relationship_map.pop(memory_id, ()):
+            relationships = self._relationship_map.get(source_id)
+            if relationships is not None:
+                relationships.pop(memory_id, None)
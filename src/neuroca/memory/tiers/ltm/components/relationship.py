@@ -6,6 +6,8 @@ maintenance, and querying of relationships between memories in the LTM tier.
 """
 
 import logging
+import sys
+from collections import deque
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -38,6 +40,8 @@ class Concept:
     properties, relationships to other concepts, and taxonomic classifications.
     """
     
+    __slots__ = ("id", "name", "description", "properties")
+    
     def __init__(
         self,
         id: str,
@@ -54,7 +58,9 @@ class Concept:
             description: Description of the concept
             properties: Dictionary of properties
         """
-        self.id = id
+        # Concept ids are reused as dict keys and relationship endpoints; interning
+        # shares one string object and lets equal ids compare by identity
+        self.id = sys.intern(id)
         self.name = name
         self.description = description
         self.properties = properties or {}
@@ -71,6 +77,8 @@ class Relationship:
     a source concept to a target concept with a specific relationship type.
     """
     
+    __slots__ = ("source_id", "target_id", "relationship_type", "strength", "metadata")
+    
     def __init__(
         self,
         source_id: str,
@@ -89,8 +97,8 @@ class Relationship:
             strength: Strength of relationship (0.0 to 1.0)
             metadata: Additional metadata
         """
-        self.source_id = source_id
-        self.target_id = target_id
+        self.source_id = sys.intern(source_id)
+        self.target_id = sys.intern(target_id)
         self.relationship_type = relationship_type
         self.strength = strength
         self.metadata = metadata or {}
@@ -163,6 +171,12 @@ class LTMRelationship:
         # Initialize relationships container if not present
         if "relationships" not in memory_item.metadata.tags:
             memory_item.metadata.tags["relationships"] = {}
+        
+        # Keep the lifecycle relationship map in step with stored relationships
+        if self._lifecycle:
+            for related_id, rel_data in memory_item.metadata.tags["relationships"].items():
+                strength = rel_data.get("strength", 0.5) if isinstance(rel_data, dict) else rel_data
+                self._lifecycle.update_relationship(memory_item.id, related_id, strength)
     
     def process_pre_delete(self, memory_id: str) -> None:
         """
@@ -312,14 +326,7 @@ class LTMRelationship:
         
         # Update relationship map
         if source_success and self._lifecycle:
-            # Update by directly modifying the map - remove_relationship not available
-            relationship_map = self._lifecycle.get_relationship_map()
-            if memory_id in relationship_map and related_id in relationship_map[memory_id]:
-                # Update the cached copy directly
-                if memory_id in relationship_map:
-                    rel_dict = relationship_map[memory_id]
-                    if related_id in rel_dict:
-                        del rel_dict[related_id]
+            self._lifecycle.remove_relationship(memory_id, related_id)
         
         # Remove bidirectional relationship if requested and target exists
         target_success = True
@@ -338,14 +345,7 @@ class LTMRelationship:
                 
                 # Update relationship map
                 if target_success and self._lifecycle:
-                    # Update by directly modifying the map
-                    relationship_map = self._lifecycle.get_relationship_map()
-                    if related_id in relationship_map and memory_id in relationship_map[related_id]:
-                        # Update the cached copy directly
-                        if related_id in relationship_map:
-                            rel_dict = relationship_map[related_id]
-                            if memory_id in rel_dict:
-                                del rel_dict[memory_id]
+                    self._lifecycle.remove_relationship(related_id, memory_id)
         
         return source_success and target_success
     
@@ -441,12 +441,76 @@ class LTMRelationship:
         Raises:
             TierOperationError: If the operation fails
         """
+        if self._lifecycle is None:
+            return await self._find_path_via_backend(start_id, end_id, max_depth)
+        
+        # Breadth-first search over the in-memory relationship map; only the
+        # memories on the path that is found are read from the backend
+        parents: Dict[str, Optional[str]] = {start_id: None}
+        depths = {start_id: 1}
+        queue = deque([start_id])
+        
+        while queue:
+            current_id = queue.popleft()
+            
+            # Check if we've reached the end
+            if current_id == end_id:
+                break
+                
+            # Stop if we've reached the maximum depth
+            if depths[current_id] >= max_depth:
+                continue
+                
+            for related_id in self._lifecycle.get_related_ids(current_id):
+                if related_id not in parents:
+                    parents[related_id] = current_id
+                    depths[related_id] = depths[current_id] + 1
+                    queue.append(related_id)
+        else:
+            # No path found
+            return None
+        
+        # Walk back from the end to recover the path, then load its memories
+        path_ids = []
+        node_id: Optional[str] = end_id
+        while node_id is not None:
+            path_ids.append(node_id)
+            node_id = parents[node_id]
+        
+        path = []
+        for memory_id in reversed(path_ids):
+            memory_data = await self._backend.retrieve(memory_id)
+            if memory_data is None:
+                return None
+            path.append(memory_data)
+        
+        return path
+    
+    async def _find_path_via_backend(
+        self,
+        start_id: str,
+        end_id: str,
+        max_depth: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find a path by reading each visited memory's relationships from the backend.
+        
+        Used when no lifecycle relationship map is configured.
+        
+        Args:
+            start_id: The ID of the starting memory
+            end_id: The ID of the ending memory
+            max_depth: Maximum path length/depth
+            
+        Returns:
+            List of memories forming the path, or None if no path found
+        """
         # Breadth-first search to find the shortest path
         visited = set()
-        queue = [(start_id, [])]  # (memory_id, path_so_far)
+        queue = deque([(start_id, [])])  # (memory_id, path_so_far)
         
         while queue:
-            current_id, path = queue.pop(0)
+            current_id, path = queue.popleft()
             
             # Skip if already visited
             if current_id in visited:
@@ -108,7 +108,6 @@ def sample_memories() -> List[MemoryItem]:
 class TestTierIntegration:
     """Test integration between memory tiers."""
     
-    @pytest.mark.asyncio
     async def test_stm_storage_and_retrieval(self, memory_tiers, sample_memories):
         """Test that STM can store and retrieve memories."""
         stm = memory_tiers["stm"]
@@ -130,7 +129,6 @@ class TestTierIntegration:
             assert retrieved.content == sample_memories[i].content
             assert retrieved.metadata.importance == sample_memories[i].metadata.importance
     
-    @pytest.mark.asyncio
     async def test_cross_tier_transfer(self, memory_tiers, sample_memories):
         """Test memory transfer between tiers."""
         stm = memory_tiers["stm"]
@@ -166,7 +164,6 @@ class TestTierIntegration:
         # But still in MTM
         assert await mtm.retrieve(mtm_id) is not None
     
-    @pytest.mark.asyncio
     async def test_vector_search(self, memory_tiers, sample_memories):
         """Test vector search across tiers."""
         ltm = memory_tiers["ltm"]
@@ -190,7 +187,6 @@ class TestTierIntegration:
 class TestMemoryManagerIntegration:
     """Test memory manager integration with tiers."""
     
-    @pytest.mark.asyncio
     async def test_direct_storage(self, memory_manager, sample_memories):
         """Test direct storage and retrieval via tiers."""
         # Store directly in STM tier
@@ -208,7 +204,6 @@ class TestMemoryManagerIntegration:
         assert isinstance(retrieved, MemoryItem)
         assert retrieved.content.text == memory.content.text
     
-    @pytest.mark.asyncio
     async def test_tier_transfer(self, memory_manager, sample_memories):
         """Test basic memory transfer between tiers."""
         # Store a memory in STM
@@ -242,7 +237,6 @@ class TestMemoryManagerIntegration:
         # Verify the memory is now in MTM
         assert await memory_manager.mtm_storage.exists(mtm_id)
     
-    @pytest.mark.asyncio
     async def test_multi_tier_storage(self, memory_manager, sample_memories):
         """Test storing memories in different tiers."""
         # Store memories in different tiers
@@ -276,7 +270,6 @@ class TestMemoryManagerIntegration:
         assert isinstance(ltm_memory, MemoryItem)
         assert ltm_memory.content.text == sample_memories[2].content.text
     
-    @pytest.mark.asyncio
     async def test_memory_context(self, memory_manager, sample_memories):
         """Test retrieving context-relevant memories."""
         # Store memories
@@ -301,7 +294,6 @@ class TestBackendIntegration:
             True, reason="Redis server might not be available in test environment"
         )),
     ])
-    @pytest.mark.asyncio
     async def test_backend_compatibility(self, backend_type, sample_memories):
         """Test compatibility with different backend types."""
         # Skip certain backends if necessary based on environment
@@ -13,8 +13,6 @@ NOTE: THIS TEST FILE REQUIRES MAJOR REFACTORING FOR THE NEW MEMORY ARCHITECTURE.
 
 import asyncio
 import os
-import shutil
-import tempfile
 from datetime import datetime
 from typing import Dict, Any, List
 
@@ -31,36 +29,29 @@ from neuroca.memory.mtm.storage import MTMMemory, MemoryPriority, MemoryStatus a
 
 
 @pytest.fixture(scope="module")
-def test_dirs():
+def test_dirs(tmp_path_factory):
     """Create temporary directories for test storage."""
-    # Create base directory
-    base_dir = tempfile.mkdtemp(prefix="neuroca_test_")
+    # Create base directory; pytest removes it with its other temp dirs
+    base_dir = str(tmp_path_factory.mktemp("neuroca_test_"))
     
     # Create subdirectories for each tier
     stm_dir = os.path.join(base_dir, "stm")
     mtm_dir = os.path.join(base_dir, "mtm")
     ltm_dir = os.path.join(base_dir, "ltm")
-    vector_dir = os.path.join(base_dir, "vector")
     
     os.makedirs(stm_dir, exist_ok=True)
     os.makedirs(mtm_dir, exist_ok=True)
     os.makedirs(ltm_dir, exist_ok=True)
-    os.makedirs(vector_dir, exist_ok=True)
     
     # Return paths
-    yield {
+    return {
         "base_dir": base_dir,
         "stm_dir": stm_dir,
         "mtm_dir": mtm_dir,
         "ltm_dir": ltm_dir,
-        "vector_dir": vector_dir,
     }
-    
-    # Clean up
-    shutil.rmtree(base_dir)
 
 
-@pytest.mark.asyncio
 async def test_memory_flow_between_tiers(test_dirs):
     """
     Test the flow of memories between different tiers (STM -> MTM -> LTM).
@@ -89,7 +80,7 @@ async def test_memory_flow_between_tiers(test_dirs):
     vector_config = {
         "dimension": 3,  # Small dimension for testing
         "similarity_threshold": 0.7,
-        "index_path": os.path.join(test_dirs["vector_dir"], "vector_index.json"),
+        "index_path": None,  # Keep the index in memory
     }
     
     # Create storage instances
@@ -238,7 +229,6 @@ async def test_memory_flow_between_tiers(test_dirs):
         assert memory["id"] in result_ids
 
 
-@pytest.mark.asyncio
 async def test_memory_retrieval_by_priority(test_dirs):
     """
     Test retrieving memories based on priority across tiers.
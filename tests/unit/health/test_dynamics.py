@@ -165,19 +165,20 @@ class TestComponentHealth:
         
         # Energy should decay
         expected_energy = initial_energy - (component_health.get_parameter("energy").decay_rate * elapsed_time)
-        assert get_param_value(component_health, "energy") == pytest.approx(expected_energy, TOLERANCE)
         
         # Attention decays AND recovers in NORMAL state, potentially clamping at max
         attention_param = component_health.get_parameter("attention")
         expected_attention = initial_attention - (attention_param.decay_rate * elapsed_time) + (attention_param.recovery_rate * elapsed_time)
         expected_attention = max(attention_param.min_value, min(attention_param.max_value, expected_attention)) # Apply clamping
-        assert get_param_value(component_health, "attention") == pytest.approx(expected_attention, TOLERANCE)
         
         # Fatigue should increase (decay) and decrease (recovery) in NORMAL state
         fatigue_param = component_health.get_parameter("fatigue")
         calculated_fatigue = initial_fatigue + (fatigue_param.decay_rate * elapsed_time) - (fatigue_param.recovery_rate * elapsed_time)
         expected_clamped_fatigue = max(fatigue_param.min_value, min(fatigue_param.max_value, calculated_fatigue)) # Apply clamping
-        assert get_param_value(component_health, "fatigue") == pytest.approx(expected_clamped_fatigue, TOLERANCE)
+
+        actual = {name: get_param_value(component_health, name) for name in ("energy", "attention", "fatigue")}
+        expected = {"energy": expected_energy, "attention": expected_attention, "fatigue": expected_clamped_fatigue}
+        assert actual == pytest.approx(expected, rel=TOLERANCE)
 
     def test_apply_natural_processes_recovery_fatigued(self, component_health: ComponentHealth):
         """Test enhanced recovery when FATIGUED."""
@@ -200,12 +201,14 @@ class TestComponentHealth:
         # Energy decays but also recovers due to FATIGUED state recovery boost, check clamping
         expected_energy = initial_energy - (energy_param.decay_rate * elapsed_time) + (boosted_energy_recovery * elapsed_time)
         expected_energy = max(energy_param.min_value, min(energy_param.max_value, expected_energy)) # Apply clamping
-        assert get_param_value(component_health, "energy") == pytest.approx(expected_energy, TOLERANCE)
 
         # Fatigue increases (decay) but recovers faster, check clamping
         calculated_fatigue = initial_fatigue + (fatigue_param.decay_rate * elapsed_time) - (boosted_fatigue_recovery * elapsed_time)
         expected_clamped_fatigue = max(fatigue_param.min_value, min(fatigue_param.max_value, calculated_fatigue)) # Apply clamping
-        assert get_param_value(component_health, "fatigue") == pytest.approx(expected_clamped_fatigue, TOLERANCE)
+
+        actual = {name: get_param_value(component_health, name) for name in ("energy", "fatigue")}
+        expected = {"energy": expected_energy, "fatigue": expected_clamped_fatigue}
+        assert actual == pytest.approx(expected, rel=TOLERANCE)
 
     def test_apply_natural_processes_stressed(self, component_health: ComponentHealth):
         """Test increased decay when STRESSED."""
@@ -230,11 +233,13 @@ class TestComponentHealth:
         # Energy decays faster and recovers, check clamping
         expected_energy = initial_energy - (boosted_energy_decay * elapsed_time) + (boosted_energy_recovery * elapsed_time)
         expected_energy = max(energy_param.min_value, min(energy_param.max_value, expected_energy)) # Apply clamping
-        assert get_param_value(component_health, "energy") == pytest.approx(expected_energy, TOLERANCE)
 
         # Attention decays faster, no recovery in STRESSED state, check clamping
         expected_attention = initial_attention - (boosted_attention_decay * elapsed_time)
-        assert get_param_value(component_health, "attention") == pytest.approx(expected_attention, TOLERANCE)
+
+        actual = {name: get_param_value(component_health, name) for name in ("energy", "attention")}
+        expected = {"energy": expected_energy, "attention": expected_attention}
+        assert actual == pytest.approx(expected, rel=TOLERANCE)
 
     def test_apply_natural_processes_critical(self, component_health: ComponentHealth):
         """Test reduced decay and max recovery when CRITICAL."""
@@ -261,12 +266,14 @@ class TestComponentHealth:
         expected_energy = initial_energy - (reduced_energy_decay * elapsed_time)
         # Note: The code currently doesn't apply energy recovery in CRITICAL state, only FATIGUED, STRESSED, IMPAIRED.
         # If recovery *should* apply, the expected value would change. Let's test current logic.
-        assert get_param_value(component_health, "energy") == pytest.approx(expected_energy, TOLERANCE)
 
         # Fatigue decay is minimal, recovery is maximized, check clamping
         expected_fatigue = initial_fatigue + (reduced_fatigue_decay * elapsed_time) - (max_fatigue_recovery * elapsed_time)
         expected_fatigue = max(fatigue_param.min_value, min(fatigue_param.max_value, expected_fatigue)) # Apply clamping
-        assert get_param_value(component_health, "fatigue") == pytest.approx(expected_fatigue, TOLERANCE)
+
+        actual = {name: get_param_value(component_health, name) for name in ("energy", "fatigue")}
+        expected = {"energy": expected_energy, "fatigue": expected_fatigue}
+        assert actual == pytest.approx(expected, rel=TOLERANCE)
 
     def test_event_history_limit(self, component_health: ComponentHealth):
         """Test that the event history is trimmed correctly."""
@@ -425,36 +432,31 @@ class TestHealthDynamicsManager:
     # testing it in an integration test setting.
 
 # Test global functions (which use the singleton manager)
-# Need to ensure the global manager is reset between tests if necessary,
-# or mock get_health_dynamics()
-
-@pytest.fixture(autouse=True)
-def reset_global_manager():
-    """Fixture to reset the global manager before each test function."""
-    global _health_dynamics
-    # Store original and replace
-    get_health_dynamics()
+# Only these tests request the global_manager fixture; the class-based
+# tests above never touch the module-level singleton.
+
+@pytest.fixture()
+def global_manager():
+    """Fixture to swap in a fresh global manager for tests that use the module-level functions."""
     new_manager = HealthDynamicsManager()
-    
+
     # Use patch to replace the global instance within the dynamics module
     with patch('neuroca.core.health.dynamics._health_dynamics', new_manager):
         yield new_manager # Provide the new manager if needed by tests
-        
-    # Restore (though typically not strictly needed as tests should isolate)
-    # _health_dynamics = original_manager # This assignment might not work as expected due to import caching
 
-def test_global_register_component():
+def test_global_register_component(global_manager: HealthDynamicsManager):
     """Test the global register_component_for_health_tracking function."""
     health = register_component_for_health_tracking(TEST_COMPONENT_ID)
     assert health is not None
     assert health.component_id == TEST_COMPONENT_ID
     # Verify it used the (patched) global manager
-    assert get_health_dynamics().get_component_health(TEST_COMPONENT_ID) is health
+    assert get_health_dynamics() is global_manager
+    assert global_manager.get_component_health(TEST_COMPONENT_ID) is health
 
-def test_global_record_operation():
+def test_global_record_operation(global_manager: HealthDynamicsManager):
     """Test the global record_cognitive_operation function."""
     register_component_for_health_tracking(TEST_COMPONENT_ID)
-    health = get_health_dynamics().get_component_health(TEST_COMPONENT_ID)
+    health = global_manager.get_component_health(TEST_COMPONENT_ID)
     initial_energy = get_param_value(health, "energy")
     
     record_cognitive_operation(TEST_COMPONENT_ID, "global_op", 0.5)
@@ -0,0 +1,15 @@
+"""
+Pytest fixtures for LLM integration tests.
+
+This module provides fixtures shared by the integration unit tests, such as
+fixed timestamps for the request/response models.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Fixture that provides a fixed timestamp for model created_at values."""
+    return 1_700_000_000.0
+
@@ -5,28 +5,38 @@ This module tests the exception classes in the LLM integration layer, ensuring
 that they behave correctly and provide the expected functionality.
 """
 
+import inspect
 
+import pytest
+
+from neuroca.integration import exceptions
 from neuroca.integration.exceptions import (
     AdapterExecutionError,
-    AuthenticationError,
-    ConfigurationError,
     ContextLengthExceededError,
-    FeatureNotSupportedError,
-    GoalContextError,
-    HealthAwarenessError,
-    InvalidRequestError,
     LLMIntegrationError,
-    MemoryContextError,
-    ModelNotAvailableError,
     ProviderAPIError,
-    ProviderConnectionError,
-    ProviderNotFoundError,
-    ProviderTimeoutError,
     RateLimitError,
-    ResourceExhaustedError,
-    ResponseParsingError,
 )
 
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _walk_subclasses(cls):
+    """Yield every subclass of cls, recursing into deeper hierarchies."""
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _walk_subclasses(subclass)
+
+
+# Exceptions that accept extra keyword details, with the attributes they populate
+EXTRA_ARG_CASES = [
+    (RateLimitError, {"retry_after": 60.0}),
+    (ContextLengthExceededError, {"max_tokens": 4096, "actual_tokens": 5000}),
+    (ProviderAPIError, {"status_code": 400, "response_body": '{"error": "Bad request"}'}),
+    (AdapterExecutionError, {"provider": "openai", "model": "gpt-4"}),
+]
+EXTRA_ARG_IDS = [cls.__name__ for cls, _ in EXTRA_ARG_CASES]
+
 
 class TestBaseException:
     """Test the base LLMIntegrationError class."""
@@ -41,179 +51,38 @@ class TestBaseException:
         """Test that LLMIntegrationError inherits from Exception."""
         error = LLMIntegrationError("Test error")
         assert isinstance(error, Exception)
-
-
-class TestProviderExceptions:
-    """Test provider-related exception classes."""
-    
-    def test_provider_not_found_error(self):
-        """Test ProviderNotFoundError."""
-        error = ProviderNotFoundError("Provider 'test' not found")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Provider 'test' not found"
-    
-    def test_model_not_available_error(self):
-        """Test ModelNotAvailableError."""
-        error = ModelNotAvailableError("Model 'gpt-5' not available")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Model 'gpt-5' not available"
-    
-    def test_authentication_error(self):
-        """Test AuthenticationError."""
-        error = AuthenticationError("Invalid API key")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Invalid API key"
-
-
-class TestRateLimitError:
-    """Test RateLimitError class."""
-    
-    def test_constructor_with_retry_after(self):
-        """Test constructor with retry_after parameter."""
-        error = RateLimitError("Rate limit exceeded", retry_after=60.0)
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Rate limit exceeded"
-        assert error.retry_after == 60.0
-    
-    def test_constructor_without_retry_after(self):
-        """Test constructor without retry_after parameter."""
-        error = RateLimitError("Rate limit exceeded")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Rate limit exceeded"
-        assert error.retry_after is None
-
-
-class TestContextLengthExceededError:
-    """Test ContextLengthExceededError class."""
-    
-    def test_constructor_with_token_info(self):
-        """Test constructor with token information."""
-        error = ContextLengthExceededError(
-            "Context length exceeded",
-            max_tokens=4096,
-            actual_tokens=5000
-        )
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Context length exceeded"
-        assert error.max_tokens == 4096
-        assert error.actual_tokens == 5000
-    
-    def test_constructor_without_token_info(self):
-        """Test constructor without token information."""
-        error = ContextLengthExceededError("Context length exceeded")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Context length exceeded"
-        assert error.max_tokens is None
-        assert error.actual_tokens is None
-
-
-class TestProviderAPIError:
-    """Test ProviderAPIError class."""
-    
-    def test_constructor_with_details(self):
-        """Test constructor with status code and response body."""
-        error = ProviderAPIError(
-            "API error occurred",
-            status_code=400,
-            response_body='{"error": "Bad request"}'
-        )
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "API error occurred"
-        assert error.status_code == 400
-        assert error.response_body == '{"error": "Bad request"}'
-    
-    def test_constructor_without_details(self):
-        """Test constructor without status code and response body."""
-        error = ProviderAPIError("API error occurred")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "API error occurred"
-        assert error.status_code is None
-        assert error.response_body is None
-
-
-class TestAdapterExecutionError:
-    """Test AdapterExecutionError class."""
-    
-    def test_constructor_with_details(self):
-        """Test constructor with provider and model details."""
-        error = AdapterExecutionError(
-            "Execution failed",
-            provider="openai",
-            model="gpt-4"
-        )
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Execution failed"
-        assert error.provider == "openai"
-        assert error.model == "gpt-4"
-    
-    def test_constructor_without_details(self):
-        """Test constructor without provider and model details."""
-        error = AdapterExecutionError("Execution failed")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Execution failed"
-        assert error.provider is None
-        assert error.model is None
-
-
-class TestOtherExceptions:
-    """Test other exception classes."""
-    
-    def test_invalid_request_error(self):
-        """Test InvalidRequestError."""
-        error = InvalidRequestError("Invalid request parameters")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Invalid request parameters"
-    
-    def test_provider_timeout_error(self):
-        """Test ProviderTimeoutError."""
-        error = ProviderTimeoutError("Request timed out after 60s")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Request timed out after 60s"
-    
-    def test_provider_connection_error(self):
-        """Test ProviderConnectionError."""
-        error = ProviderConnectionError("Failed to connect to API")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Failed to connect to API"
-    
-    def test_response_parsing_error(self):
-        """Test ResponseParsingError."""
-        error = ResponseParsingError("Failed to parse JSON response")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Failed to parse JSON response"
-    
-    def test_configuration_error(self):
-        """Test ConfigurationError."""
-        error = ConfigurationError("Invalid configuration")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Invalid configuration"
-    
-    def test_resource_exhausted_error(self):
-        """Test ResourceExhaustedError."""
-        error = ResourceExhaustedError("API quota exceeded")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "API quota exceeded"
-    
-    def test_feature_not_supported_error(self):
-        """Test FeatureNotSupportedError."""
-        error = FeatureNotSupportedError("Function calling not supported")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Function calling not supported"
-    
-    def test_memory_context_error(self):
-        """Test MemoryContextError."""
-        error = MemoryContextError("Failed to retrieve memories")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Failed to retrieve memories"
-    
-    def test_health_awareness_error(self):
-        """Test HealthAwarenessError."""
-        error = HealthAwarenessError("Failed to get health state")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Failed to get health state"
     
-    def test_goal_context_error(self):
-        """Test GoalContextError."""
-        error = GoalContextError("Failed to retrieve active goals")
-        assert isinstance(error, LLMIntegrationError)
-        assert error.message == "Failed to retrieve active goals"
+    def test_all_exceptions_inherit_base(self):
+        """Test that every exception in the module derives from LLMIntegrationError."""
+        exception_classes = [
+            cls for _, cls in inspect.getmembers(exceptions, inspect.isclass)
+            if issubclass(cls, Exception) and cls.__module__ == exceptions.__name__
+        ]
+        assert len(exception_classes) > 1
+        for cls in exception_classes:
+            assert issubclass(cls, LLMIntegrationError), cls.__name__
+
+
+@pytest.mark.parametrize("cls", list(_walk_subclasses(LLMIntegrationError)), ids=lambda cls: cls.__name__)
+def test_exception_message(cls):
+    """Test that every exception class can be built from a message alone."""
+    error = cls("Test error message")
+    assert error.message == "Test error message"
+    assert str(error) == "Test error message"
+
+
+@pytest.mark.parametrize(("cls", "details"), EXTRA_ARG_CASES, ids=EXTRA_ARG_IDS)
+def test_exception_with_details(cls, details):
+    """Test constructors that accept extra details."""
+    error = cls("Test error message", **details)
+    assert error.message == "Test error message"
+    for name, value in details.items():
+        assert getattr(error, name) == value
+
+
+@pytest.mark.parametrize(("cls", "details"), EXTRA_ARG_CASES, ids=EXTRA_ARG_IDS)
+def test_exception_details_default_to_none(cls, details):
+    """Test that extra details default to None when omitted."""
+    error = cls("Test error message")
+    for name in details:
+        assert getattr(error, name) is None
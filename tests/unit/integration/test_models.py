@@ -10,6 +10,9 @@ This module tests the data models used in the LLM integration layer, including:
 """
 
 import time
+from dataclasses import asdict, replace
+
+import pytest
 
 from neuroca.integration.models import (
     LLMError,
@@ -21,6 +24,22 @@ from neuroca.integration.models import (
     TokenUsage,
 )
 
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+# Canonical model instances shared across tests; tests must treat them as read-only
+# and use dataclasses.replace() when they need a variation.
+GPT4_REQUEST = LLMRequest(provider="openai", model="gpt-4", prompt="Test prompt")
+SAMPLE_USAGE = TokenUsage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+CHAT_RESPONSE = LLMResponse(
+    provider="openai",
+    model="gpt-4",
+    content="Test response",
+    usage=SAMPLE_USAGE,
+    request=GPT4_REQUEST,
+    response_type=ResponseType.CHAT
+)
+
 
 class TestTokenUsage:
     """Test suite for the TokenUsage class."""
@@ -41,25 +60,12 @@ class TestTokenUsage:
     
     def test_to_dict(self):
         """Test conversion to dictionary."""
-        usage = TokenUsage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
-        usage_dict = usage.to_dict()
+        usage_dict = SAMPLE_USAGE.to_dict()
         assert usage_dict == {
             "prompt_tokens": 10,
             "completion_tokens": 20,
             "total_tokens": 30
         }
-    
-    def test_from_dict(self):
-        """Test creation from dictionary."""
-        usage_dict = {
-            "prompt_tokens": 10,
-            "completion_tokens": 20,
-            "total_tokens": 30
-        }
-        usage = TokenUsage.from_dict(usage_dict)
-        assert usage.prompt_tokens == 10
-        assert usage.completion_tokens == 20
-        assert usage.total_tokens == 30
 
 
 class TestProviderConfig:
@@ -105,28 +111,13 @@ class TestProviderConfig:
         """Test conversion to dictionary with sensitive info masking."""
         config = ProviderConfig(api_key="sk_1234567890abcdef")
         config_dict = config.to_dict(mask_secrets=True)
-        assert "api_key" in config_dict
-        assert config_dict["api_key"] != "sk_1234567890abcdef"
-        assert config_dict["api_key"].startswith("**********")
-        assert config_dict["api_key"].endswith("cdef")  # Last 4 chars preserved
+        assert config_dict["api_key"] == "**********cdef"  # Fixed mask, last 4 chars preserved
     
     def test_to_dict_without_masking(self):
         """Test conversion to dictionary without sensitive info masking."""
         config = ProviderConfig(api_key="sk_1234567890abcdef")
         config_dict = config.to_dict(mask_secrets=False)
         assert config_dict["api_key"] == "sk_1234567890abcdef"
-    
-    def test_from_dict(self):
-        """Test creation from dictionary."""
-        config_dict = {
-            "api_key": "test_key",
-            "api_base": "https://api.example.com",
-            "default_model": "gpt-4"
-        }
-        config = ProviderConfig.from_dict(config_dict)
-        assert config.api_key == "test_key"
-        assert config.api_base == "https://api.example.com"
-        assert config.default_model == "gpt-4"
 
 
 class TestLLMRequest:
@@ -134,16 +125,16 @@ class TestLLMRequest:
     
     def test_init_with_required_values(self):
         """Test initialization with only required values."""
+        before = time.time()
         request = LLMRequest(provider="openai")
         assert request.provider == "openai"
         assert request.model is None
         assert request.prompt is None
         assert isinstance(request.additional_params, dict)
-        assert request.created_at > 0  # Should be a timestamp
+        assert before <= request.created_at <= time.time()
     
-    def test_init_with_all_values(self):
+    def test_init_with_all_values(self, now):
         """Test initialization with all values."""
-        now = time.time()
         request = LLMRequest(
             provider="openai",
             model="gpt-4",
@@ -171,37 +162,14 @@ class TestLLMRequest:
         assert request.additional_params == {"custom": "value"}
         assert request.created_at == now
     
-    def test_to_dict(self):
+    def test_to_dict(self, now):
         """Test conversion to dictionary."""
-        now = time.time()
-        request = LLMRequest(
-            provider="openai",
-            model="gpt-4",
-            prompt="Test prompt",
-            created_at=now
-        )
+        request = replace(GPT4_REQUEST, created_at=now)
         request_dict = request.to_dict()
         assert request_dict["provider"] == "openai"
         assert request_dict["model"] == "gpt-4"
         assert request_dict["prompt"] == "Test prompt"
         assert request_dict["created_at"] == now
-    
-    def test_from_dict(self):
-        """Test creation from dictionary."""
-        now = time.time()
-        request_dict = {
-            "provider": "openai",
-            "model": "gpt-4",
-            "prompt": "Test prompt",
-            "max_tokens": 100,
-            "created_at": now
-        }
-        request = LLMRequest.from_dict(request_dict)
-        assert request.provider == "openai"
-        assert request.model == "gpt-4"
-        assert request.prompt == "Test prompt"
-        assert request.max_tokens == 100
-        assert request.created_at == now
 
 
 class TestLLMResponse:
@@ -209,6 +177,7 @@ class TestLLMResponse:
     
     def test_init_with_required_values(self):
         """Test initialization with only required values."""
+        before = time.time()
         response = LLMResponse(
             provider="openai",
             model="gpt-4",
@@ -222,25 +191,21 @@ class TestLLMResponse:
         assert response.usage is None
         assert response.cost is None
         assert response.request is None
-        assert response.created_at > 0  # Should be a timestamp
+        assert before <= response.created_at <= time.time()
         assert response.elapsed_time is None
         assert response.response_type == ResponseType.TEXT
     
-    def test_init_with_all_values(self):
+    def test_init_with_all_values(self, now):
         """Test initialization with all values."""
-        now = time.time()
-        request = LLMRequest(provider="openai", model="gpt-4", prompt="Test prompt")
-        usage = TokenUsage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
-        
         response = LLMResponse(
             provider="openai",
             model="gpt-4",
             content="Test response",
             raw_response={"choices": [{"text": "Test response"}]},
             metadata={"source": "test"},
-            usage=usage,
+            usage=SAMPLE_USAGE,
             cost=0.05,
-            request=request,
+            request=GPT4_REQUEST,
             created_at=now,
             elapsed_time=0.5,
             response_type=ResponseType.CHAT
@@ -251,74 +216,29 @@ class TestLLMResponse:
         assert response.content == "Test response"
         assert response.raw_response == {"choices": [{"text": "Test response"}]}
         assert response.metadata == {"source": "test"}
-        assert response.usage == usage
+        assert response.usage == SAMPLE_USAGE
         assert response.cost == 0.05
-        assert response.request == request
+        assert response.request == GPT4_REQUEST
         assert response.created_at == now
         assert response.elapsed_time == 0.5
         assert response.response_type == ResponseType.CHAT
     
-    def test_to_dict(self):
+    def test_to_dict(self, now):
         """Test conversion to dictionary."""
-        now = time.time()
-        request = LLMRequest(provider="openai", model="gpt-4", prompt="Test prompt")
-        usage = TokenUsage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
-        
-        response = LLMResponse(
-            provider="openai",
-            model="gpt-4",
-            content="Test response",
-            usage=usage,
-            request=request,
-            created_at=now,
-            response_type=ResponseType.CHAT
-        )
-        
-        response_dict = response.to_dict()
-        assert response_dict["provider"] == "openai"
-        assert response_dict["model"] == "gpt-4"
-        assert response_dict["content"] == "Test response"
-        assert response_dict["usage"] == usage.to_dict()
-        assert response_dict["request"] == request.to_dict()
-        assert response_dict["created_at"] == now
-        assert response_dict["response_type"] == "chat"
-    
-    def test_from_dict(self):
-        """Test creation from dictionary."""
-        now = time.time()
-        usage_dict = {
-            "prompt_tokens": 10,
-            "completion_tokens": 20,
-            "total_tokens": 30
-        }
-        request_dict = {
-            "provider": "openai",
-            "model": "gpt-4",
-            "prompt": "Test prompt"
-        }
-        
-        response_dict = {
+        response = replace(CHAT_RESPONSE, created_at=now)
+        assert response.to_dict() == {
             "provider": "openai",
             "model": "gpt-4",
             "content": "Test response",
-            "usage": usage_dict,
-            "request": request_dict,
+            "raw_response": None,
+            "metadata": {},
+            "usage": asdict(SAMPLE_USAGE),
+            "cost": None,
+            "request": asdict(GPT4_REQUEST),
             "created_at": now,
+            "elapsed_time": None,
             "response_type": "chat"
         }
-        
-        response = LLMResponse.from_dict(response_dict)
-        assert response.provider == "openai"
-        assert response.model == "gpt-4"
-        assert response.content == "Test response"
-        assert response.usage.prompt_tokens == 10
-        assert response.usage.completion_tokens == 20
-        assert response.usage.total_tokens == 30
-        assert response.request.provider == "openai"
-        assert response.request.model == "gpt-4"
-        assert response.request.prompt == "Test prompt"
-        assert response.created_at == now
-        assert response.response_type == ResponseType.CHAT
 
 
 class TestLLMError:
@@ -326,6 +246,7 @@ class TestLLMError:
     
     def test_init_with_required_values(self):
         """Test initialization with only required values."""
+        before = time.time()
         error = LLMError(
             provider="openai",
             error_type="rate_limit",
@@ -335,19 +256,16 @@ class TestLLMError:
         assert error.error_type == "rate_limit"
         assert error.message == "Rate limit exceeded"
         assert error.request is None
-        assert error.created_at > 0  # Should be a timestamp
+        assert before <= error.created_at <= time.time()
         assert error.retryable is False
     
-    def test_init_with_all_values(self):
+    def test_init_with_all_values(self, now):
         """Test initialization with all values."""
-        now = time.time()
-        request = LLMRequest(provider="openai", model="gpt-4", prompt="Test prompt")
-        
         error = LLMError(
             provider="openai",
             error_type="rate_limit",
             message="Rate limit exceeded",
-            request=request,
+            request=GPT4_REQUEST,
             created_at=now,
             retryable=True
         )
@@ -355,84 +273,93 @@ class TestLLMError:
         assert error.provider == "openai"
         assert error.error_type == "rate_limit"
         assert error.message == "Rate limit exceeded"
-        assert error.request == request
+        assert error.request == GPT4_REQUEST
         assert error.created_at == now
         assert error.retryable is True
     
-    def test_to_dict(self):
+    def test_to_dict(self, now):
         """Test conversion to dictionary."""
-        now = time.time()
-        request = LLMRequest(provider="openai", model="gpt-4", prompt="Test prompt")
-        
         error = LLMError(
             provider="openai",
             error_type="rate_limit",
             message="Rate limit exceeded",
-            request=request,
+            request=GPT4_REQUEST,
             created_at=now,
             retryable=True
         )
         
-        error_dict = error.to_dict()
-        assert error_dict["provider"] == "openai"
-        assert error_dict["error_type"] == "rate_limit"
-        assert error_dict["message"] == "Rate limit exceeded"
-        assert error_dict["request"] == request.to_dict()
-        assert error_dict["created_at"] == now
-        assert error_dict["retryable"] is True
-    
-    def test_from_dict(self):
-        """Test creation from dictionary."""
-        now = time.time()
-        request_dict = {
-            "provider": "openai",
-            "model": "gpt-4",
-            "prompt": "Test prompt"
-        }
-        
-        error_dict = {
+        assert error.to_dict() == {
             "provider": "openai",
             "error_type": "rate_limit",
             "message": "Rate limit exceeded",
-            "request": request_dict,
+            "request": asdict(GPT4_REQUEST),
             "created_at": now,
             "retryable": True
         }
-        
-        error = LLMError.from_dict(error_dict)
-        assert error.provider == "openai"
-        assert error.error_type == "rate_limit"
-        assert error.message == "Rate limit exceeded"
-        assert error.request.provider == "openai"
-        assert error.request.model == "gpt-4"
-        assert error.request.prompt == "Test prompt"
-        assert error.created_at == now
-        assert error.retryable is True
+
+
+ROUNDTRIP_CASES = [
+    pytest.param(SAMPLE_USAGE, {}, id="TokenUsage"),
+    pytest.param(
+        ProviderConfig(api_key="test_key", api_base="https://api.example.com", default_model="gpt-4"),
+        {"mask_secrets": False},
+        id="ProviderConfig",
+    ),
+    pytest.param(
+        LLMRequest(provider="openai", model="gpt-4", prompt="Test prompt", max_tokens=100),
+        {},
+        id="LLMRequest",
+    ),
+    pytest.param(CHAT_RESPONSE, {}, id="LLMResponse"),
+    pytest.param(
+        LLMError(
+            provider="openai",
+            error_type="rate_limit",
+            message="Rate limit exceeded",
+            request=GPT4_REQUEST,
+            retryable=True
+        ),
+        {},
+        id="LLMError",
+    ),
+]
+
+
+@pytest.mark.parametrize(("obj", "to_dict_kwargs"), ROUNDTRIP_CASES)
+def test_roundtrip(obj, to_dict_kwargs):
+    """Test that from_dict restores what to_dict produced."""
+    assert type(obj).from_dict(obj.to_dict(**to_dict_kwargs)) == obj
 
 
 class TestResponseType:
     """Test suite for the ResponseType enum."""
     
-    def test_enum_values(self):
+    @pytest.mark.parametrize(("member", "expected"), [
+        (ResponseType.TEXT, "text"),
+        (ResponseType.CHAT, "chat"),
+        (ResponseType.EMBEDDING, "embedding"),
+        (ResponseType.FUNCTION_CALL, "function_call"),
+        (ResponseType.TOOL_USE, "tool_use"),
+        (ResponseType.ERROR, "error"),
+    ])
+    def test_enum_values(self, member, expected):
         """Test enum values."""
-        assert ResponseType.TEXT.value == "text"
-        assert ResponseType.CHAT.value == "chat"
-        assert ResponseType.EMBEDDING.value == "embedding"
-        assert ResponseType.FUNCTION_CALL.value == "function_call"
-        assert ResponseType.TOOL_USE.value == "tool_use"
-        assert ResponseType.ERROR.value == "error"
+        assert member.value == expected
 
 
 class TestLLMProvider:
     """Test suite for the LLMProvider enum."""
     
-    def test_enum_values(self):
+    @pytest.mark.parametrize(("member", "expected"), [
+        (LLMProvider.OPENAI, "openai"),
+        (LLMProvider.ANTHROPIC, "anthropic"),
+        (LLMProvider.COHERE, "cohere"),
+        (LLMProvider.HUGGINGFACE, "huggingface"),
+        (LLMProvider.VERTEXAI, "vertexai"),
+        (LLMProvider.OLLAMA, "ollama"),
+        (LLMProvider.LOCAL, "local"),
+        (LLMProvider.CUSTOM, "custom"),
+    ])
+    def test_enum_values(self, member, expected):
         """Test enum values."""
-        assert LLMProvider.OPENAI.value == "openai"
-        assert LLMProvider.ANTHROPIC.value == "anthropic"
-        assert LLMProvider.COHERE.value == "cohere"
-        assert LLMProvider.HUGGINGFACE.value == "huggingface"
-        assert LLMProvider.VERTEXAI.value == "vertexai"
-        assert LLMProvider.OLLAMA.value == "ollama"
-        assert LLMProvider.LOCAL.value == "local"
-        assert LLMProvider.CUSTOM.value == "custom"
+        assert member.value == expected
@@ -11,131 +11,198 @@ adapter correctly handles:
 5. Error handling
 """
 
-from unittest.mock import AsyncMock, MagicMock, call, patch
+import asyncio
+import json
+from dataclasses import replace
+from types import MappingProxyType
 
 import aiohttp
 import pytest
-from aiohttp import ClientSession
+import pytest_asyncio
+from aioresponses import CallbackResult, aioresponses
+from yarl import URL
 
-# Corrected import: Use BaseAdapter instead of LLMAdapter (which doesn't exist in base.py)
-# Also import other necessary items from base
-from neuroca.integration.adapters.base import LLMResponse
 from neuroca.integration.adapters.ollama import OllamaAdapter, OllamaError
-from neuroca.integration.models import (
-    LLMRequest,  # LLMResponse is imported above now
-    TokenUsage,
+from neuroca.integration.models import LLMRequest, LLMResponse, ResponseType, TokenUsage
+
+
+BASE_URL = "http://localhost:11434"
+
+# Canonical request; variations are derived with dataclasses.replace
+BASIC_REQUEST = LLMRequest(
+    provider="ollama",
+    model="llama3",
+    prompt="Test prompt"
 )
 
+# Canonical chat transcript covering system, user and assistant roles
+CANONICAL_MESSAGES = tuple(MappingProxyType(message) for message in [
+    {"role": "system", "content": "You are a helpful assistant"},
+    {"role": "user", "content": "Hello"},
+    {"role": "assistant", "content": "How can I help?"},
+    {"role": "user", "content": "Tell me about NCA"}
+])
+
+# Canonical API responses, frozen and pre-encoded once for the whole module
+GENERATE_RESPONSE = MappingProxyType({
+    "model": "llama3",
+    "response": "This is a test response",
+    "eval_count": 20,
+    "prompt_eval_count": 10,
+    "total_duration": 500000000  # 500ms in nanoseconds
+})
+GENERATE_BODY = json.dumps(dict(GENERATE_RESPONSE))
 
-class MockResponse:
-    """Mock aiohttp response for testing."""
+TAGS_RESPONSE = MappingProxyType({
+    "models": (
+        {"name": "llama3"},
+        {"name": "mistral"},
+        {"name": "phi3"}
+    )
+})
+TAGS_BODY = json.dumps(dict(TAGS_RESPONSE))
+
+
+class RouteRecorder:
+    """Read the requests captured by aioresponses, keyed by method and API path."""
+    
+    def __init__(self, mocked, base_url=BASE_URL):
+        self._mocked = mocked
+        self._base_url = base_url
+    
+    def sent(self, method, path):
+        """Return the JSON bodies sent to a route, in call order."""
+        calls = self._mocked.requests.get((method, URL(f"{self._base_url}{path}")), [])
+        return [call.kwargs.get("json") for call in calls]
+    
+    def last(self, method, path):
+        """Return the JSON body of the most recent request to a route."""
+        return self.sent(method, path)[-1]
+    
+    def called(self, method, path):
+        """Return whether a route received any request."""
+        return (method, URL(f"{self._base_url}{path}")) in self._mocked.requests
+
+
+class FakeExecAdapter(OllamaAdapter):
+    """OllamaAdapter that records the request and returns a canned response instead of calling the API."""
+    
+    canned: LLMResponse = None
+    last_request: LLMRequest = None
     
-    def __init__(self, status=200, data=None, text=None):
-        self.status = status
-        self.data = data if data is not None else {}
-        self.text_value = text
-        
-    async def json(self):
-        """Return JSON data."""
-        return self.data
-        
-    async def text(self):
-        """Return text data."""
-        return self.text_value
-        
-    async def __aenter__(self):
-        """Context manager entry."""
-        return self
-        
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        pass
+    async def execute(self, request: LLMRequest) -> LLMResponse:
+        self.last_request = request
+        return self.canned
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestOllamaAdapter:
     """Test suite for the OllamaAdapter class."""
     
-    @pytest.fixture()
+    @pytest.fixture(scope="session")
     def basic_config(self):
-        """Create a basic configuration for testing."""
-        return {
-            "base_url": "http://localhost:11434",
+        """Create a basic, read-only configuration shared by all tests."""
+        return MappingProxyType({
+            "base_url": BASE_URL,
             "default_model": "llama3",
             "request_timeout": 60,
             "max_retries": 3
-        }
+        })
+    
+    @pytest.fixture(scope="module")
+    def intercepted(self):
+        """Patch aiohttp once for the whole module so no real Ollama server is needed."""
+        with aioresponses() as mocked:
+            yield mocked
+    
+    @pytest.fixture
+    def mocked(self, intercepted):
+        """Hand each test the shared interceptor and reset its routes and history afterwards."""
+        yield intercepted
+        intercepted.clear()
+        intercepted.requests.clear()
     
-    @pytest.fixture()
-    def mock_session(self):
-        """Create a mock aiohttp session for testing."""
-        session = MagicMock(spec=ClientSession)
-        session.get = AsyncMock()
-        session.post = AsyncMock()
-        session.closed = False
-        session.close = AsyncMock()
-        return session
+    @pytest.fixture
+    def respond(self, mocked):
+        """Return a builder that registers a canned response for an API path."""
+        def _register(method, path, status=200, **kwargs):
+            mocked.add(f"{BASE_URL}{path}", method=method, status=status, **kwargs)
+        return _register
     
-    @pytest.fixture()
-    def ollama_adapter(self, basic_config, mock_session):
-        """Create an OllamaAdapter instance for testing."""
-        with patch('neuroca.integration.adapters.ollama.aiohttp.ClientSession', return_value=mock_session):
-            adapter = OllamaAdapter(basic_config)
-            adapter._session = mock_session
-            return adapter
+    @pytest.fixture
+    def recorder(self, mocked):
+        """Expose the captured requests by route."""
+        return RouteRecorder(mocked)
+    
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def ollama_adapter(self, basic_config, mocked):
+        """Create an OllamaAdapter instance backed by a real (intercepted) session."""
+        adapter = OllamaAdapter(basic_config)
+        yield adapter
+        await adapter.close()
+    
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def fake_adapter(self, basic_config):
+        """Create a FakeExecAdapter with a canned response."""
+        adapter = FakeExecAdapter(basic_config)
+        adapter.canned = LLMResponse(
+            provider="ollama",
+            model="llama3",
+            content="Test response",
+            usage=TokenUsage(
+                prompt_tokens=10,
+                completion_tokens=20,
+                total_tokens=30
+            )
+        )
+        yield adapter
+        await adapter.close()
     
-    async def test_initialization(self, basic_config):
+    async def test_initialization(self, ollama_adapter):
         """Test that the adapter initializes correctly."""
-        with patch('neuroca.integration.adapters.ollama.aiohttp.ClientSession'):
-            adapter = OllamaAdapter(basic_config)
-            
-            # Check default values
-            assert adapter._base_url == "http://localhost:11434"
-            assert adapter._default_model == "llama3"
-            assert adapter._request_timeout == 60
-            assert adapter._max_retries == 3
-            assert adapter._name == "ollama"
+        # Check default values
+        assert ollama_adapter._base_url == "http://localhost:11434"
+        assert ollama_adapter._default_model == "llama3"
+        assert ollama_adapter._request_timeout == 60
+        assert ollama_adapter._max_retries == 3
+        assert ollama_adapter._name == "ollama"
     
     async def test_validate_configuration(self, basic_config):
         """Test configuration validation."""
         # Test with valid configuration
-        valid_config = basic_config.copy()
-        adapter = OllamaAdapter(valid_config)
+        adapter = OllamaAdapter(dict(basic_config))
         assert adapter.validate_configuration() is True
         
         # Test with missing base_url
-        invalid_config = basic_config.copy()
-        invalid_config["base_url"] = ""
+        invalid_config = {**basic_config, "base_url": ""}
         with pytest.raises(Exception):
             OllamaAdapter(invalid_config).validate_configuration()
         
         # Test with invalid base_url format
-        invalid_config = basic_config.copy()
-        invalid_config["base_url"] = "invalid-url"
+        invalid_config = {**basic_config, "base_url": "invalid-url"}
+        with pytest.raises(Exception):
+            OllamaAdapter(invalid_config).validate_configuration()
+        
+        # Test with a non-positive embedding concurrency limit
+        invalid_config = {**basic_config, "max_concurrent_embeddings": 0}
         with pytest.raises(Exception):
             OllamaAdapter(invalid_config).validate_configuration()
     
-    async def test_close(self, ollama_adapter, mock_session):
+    async def test_close(self, ollama_adapter):
         """Test closing the adapter."""
         await ollama_adapter.close()
-        mock_session.close.assert_called_once()
+        assert ollama_adapter._session.closed
     
-    async def test_get_available_models(self, ollama_adapter, mock_session):
+    async def test_get_available_models(self, ollama_adapter, respond, recorder):
         """Test getting available models."""
         # Configure mock response
-        mock_response = MockResponse(status=200, data={
-            "models": [
-                {"name": "llama3"},
-                {"name": "mistral"},
-                {"name": "phi3"}
-            ]
-        })
-        mock_session.get.return_value = mock_response
+        respond("GET", "/api/tags", body=TAGS_BODY)
         
         # Call the method
         models = await ollama_adapter.get_available_models()
         
         # Verify the correct API endpoint was called
-        mock_session.get.assert_called_with("http://localhost:11434/api/tags")
+        assert recorder.called("GET", "/api/tags")
         
         # Verify the returned models
         assert "llama3" in models
@@ -143,215 +210,126 @@ class TestOllamaAdapter:
         assert "phi3" in models
         assert len(models) == 3
     
-    async def test_get_available_models_error(self, ollama_adapter, mock_session):
+    async def test_get_available_models_error(self, ollama_adapter, respond):
         """Test error handling for getting available models."""
         # Configure mock response for error
-        mock_response = MockResponse(status=500, text="Internal Server Error")
-        mock_session.get.return_value = mock_response
+        respond("GET", "/api/tags", status=500, body="Internal Server Error")
         
         # Call the method and expect an error
         with pytest.raises(OllamaError):
             await ollama_adapter._fetch_available_models()
     
-    async def test_execute_basic(self, ollama_adapter, mock_session):
-        """Test basic execution of a request."""
-        # Configure mock response
-        mock_response = MockResponse(status=200, data={
-            "model": "llama3",
-            "response": "This is a test response",
-            "eval_count": 20,
-            "prompt_eval_count": 10,
-            "total_duration": 500000000  # 500ms in nanoseconds
-        })
-        mock_session.post.return_value = mock_response
-        
-        # Create a request
-        request = LLMRequest(
-            provider="ollama",
-            model="llama3",
-            prompt="Test prompt"
+    @pytest.mark.parametrize("request_kwargs,status,expected_payload", [
+        pytest.param(
+            {}, 200,
+            {"model": "llama3", "prompt": "Test prompt", "stream": False},
+            id="basic",
+        ),
+        pytest.param(
+            {
+                "max_tokens": 100,
+                "temperature": 0.7,
+                "additional_params": {"top_k": 40, "top_p": 0.9}
+            },
+            200,
+            {
+                "model": "llama3",
+                "prompt": "Test prompt",
+                "stream": False,
+                "num_predict": 100,
+                "temperature": 0.7,
+                "top_k": 40,
+                "top_p": 0.9
+            },
+            id="with_parameters",
+        ),
+        pytest.param({}, 400, None, id="api_error"),
+    ])
+    async def test_execute(self, ollama_adapter, respond, recorder, request_kwargs, status, expected_payload):
+        """Test request execution, parameter mapping and API error handling."""
+        # Configure mock response; error cases get a plain-text body
+        respond(
+            "POST", "/api/generate",
+            status=status,
+            body=GENERATE_BODY if status == 200 else "Bad request"
         )
         
-        # Execute the request
+        request = replace(BASIC_REQUEST, **request_kwargs)
+        
+        if expected_payload is None:
+            with pytest.raises(OllamaError):
+                await ollama_adapter.execute(request)
+            return
+        
         response = await ollama_adapter.execute(request)
         
         # Verify the correct API endpoint was called with correct data
-        mock_session.post.assert_called_with(
-            "http://localhost:11434/api/generate",
-            json={
-                "model": "llama3",
-                "prompt": "Test prompt",
-                "stream": False
-            }
-        )
+        assert recorder.last("POST", "/api/generate") == expected_payload
         
         # Verify the response
         assert response.provider == "ollama"
         assert response.model == "llama3"
         assert response.content == "This is a test response"
-        assert response.usage.prompt_tokens == 10
-        assert response.usage.completion_tokens == 20
-        assert response.usage.total_tokens == 30
+        assert response.usage == TokenUsage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
         assert "duration_ms" in response.metadata
         assert response.cost == 0.0  # Local models have no cost
     
-    async def test_execute_with_parameters(self, ollama_adapter, mock_session):
-        """Test execution with additional parameters."""
-        # Configure mock response
-        mock_response = MockResponse(status=200, data={
-            "model": "llama3",
-            "response": "This is a test response",
-            "eval_count": 20,
-            "prompt_eval_count": 10,
-            "total_duration": 500000000
-        })
-        mock_session.post.return_value = mock_response
-        
-        # Create a request with parameters
-        request = LLMRequest(
-            provider="ollama",
-            model="llama3",
-            prompt="Test prompt",
-            max_tokens=100,
-            temperature=0.7,
-            additional_params={"top_k": 40, "top_p": 0.9}
-        )
-        
-        # Execute the request
-        await ollama_adapter.execute(request)
-        
-        # Verify the parameters were passed correctly
-        call_kwargs = mock_session.post.call_args[1]["json"]
-        assert call_kwargs["model"] == "llama3"
-        assert call_kwargs["prompt"] == "Test prompt"
-        assert call_kwargs["num_predict"] == 100
-        assert call_kwargs["temperature"] == 0.7
-        assert call_kwargs["top_k"] == 40
-        assert call_kwargs["top_p"] == 0.9
-    
-    async def test_execute_api_error(self, ollama_adapter, mock_session):
-        """Test error handling for API errors."""
-        # Configure mock response for error
-        mock_response = MockResponse(status=400, text="Bad request")
-        mock_session.post.return_value = mock_response
-        
-        # Create a request
-        request = LLMRequest(
-            provider="ollama",
-            model="llama3",
-            prompt="Test prompt"
-        )
-        
-        # Call the method and expect an error
-        with pytest.raises(OllamaError):
-            await ollama_adapter.execute(request)
-    
-    async def test_execute_connection_error(self, ollama_adapter, mock_session):
+    async def test_execute_connection_error(self, ollama_adapter, respond):
         """Test error handling for connection errors."""
-        # Configure mock session to raise exception
-        mock_session.post.side_effect = aiohttp.ClientError("Connection error")
-        
-        # Create a request
-        request = LLMRequest(
-            provider="ollama",
-            model="llama3",
-            prompt="Test prompt"
-        )
+        # Configure the route to raise a connection exception
+        respond("POST", "/api/generate", exception=aiohttp.ClientError("Connection error"))
         
         # Call the method and expect an error
         with pytest.raises(OllamaError):
-            await ollama_adapter.execute(request)
+            await ollama_adapter.execute(BASIC_REQUEST)
     
-    async def test_generate(self, ollama_adapter):
+    async def test_generate(self, fake_adapter):
         """Test the generate method."""
-        # Mock the execute method
-        ollama_adapter.execute = AsyncMock()
-        mock_response = LLMResponse(
-            provider="ollama",
-            model="llama3",
-            content="Test response",
-            usage=TokenUsage(
-                prompt_tokens=10,
-                completion_tokens=20,
-                total_tokens=30
-            )
-        )
-        ollama_adapter.execute.return_value = mock_response
-        
         # Call the generate method
-        response = await ollama_adapter.generate(
+        response = await fake_adapter.generate(
             prompt="Test prompt",
             max_tokens=100,
             temperature=0.7,
             stop_sequences=["END"]
         )
         
-        # Verify the execute method was called with correct parameters
-        ollama_adapter.execute.assert_called_once()
-        request = ollama_adapter.execute.call_args[0][0]
+        # Verify execute received a request built from the arguments
+        request = fake_adapter.last_request
         assert request.prompt == "Test prompt"
         assert request.max_tokens == 100
         assert request.temperature == 0.7
         assert request.stop_sequences == ["END"]
         
-        # Verify the response format
-        assert response["text"] == "Test response"
-        assert "usage" in response
-        assert response["model"] == "llama3"
+        # Verify the response is passed through
+        assert response is fake_adapter.canned
     
-    async def test_chat(self, ollama_adapter):
-        """Test the chat method."""
-        # Mock the generate method
-        ollama_adapter.generate = AsyncMock()
-        ollama_adapter.generate.return_value = {
-            "text": "Test response",
-            "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
-            "model": "llama3"
-        }
-        
-        # Create test messages
-        messages = [
-            {"role": "system", "content": "You are a helpful assistant"},
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "How can I help?"},
-            {"role": "user", "content": "Tell me about NCA"}
-        ]
-        
+    async def test_chat(self, fake_adapter):
+        """Test the generate_chat method."""
         # Call the chat method
-        response = await ollama_adapter.chat(
-            messages=messages,
+        response = await fake_adapter.generate_chat(
+            messages=list(CANONICAL_MESSAGES),
             max_tokens=100,
             temperature=0.7
         )
         
-        # Verify the generate method was called
-        ollama_adapter.generate.assert_called_once()
-        
         # The formatted prompt should contain all the messages
-        prompt = ollama_adapter.generate.call_args[1]["prompt"]
-        assert "You are a helpful assistant" in prompt
-        assert "Hello" in prompt
-        assert "How can I help?" in prompt
-        assert "Tell me about NCA" in prompt
+        request = fake_adapter.last_request
+        assert "You are a helpful assistant" in request.prompt
+        assert "Hello" in request.prompt
+        assert "How can I help?" in request.prompt
+        assert "Tell me about NCA" in request.prompt
         
         # Verify other parameters were passed correctly
-        assert ollama_adapter.generate.call_args[1]["max_tokens"] == 100
-        assert ollama_adapter.generate.call_args[1]["temperature"] == 0.7
+        assert request.max_tokens == 100
+        assert request.temperature == 0.7
         
         # Verify the response is passed through
-        assert response["text"] == "Test response"
+        assert response is fake_adapter.canned
     
     async def test_format_chat_messages(self, ollama_adapter):
         """Test formatting of chat messages."""
-        # Test with system, user, and assistant messages
-        messages = [
-            {"role": "system", "content": "You are a helpful assistant"},
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "How can I help?"},
-            {"role": "user", "content": "Tell me about NCA"}
-        ]
-        
-        formatted = ollama_adapter._format_chat_messages(messages)
+        # System, user, and assistant messages
+        formatted = ollama_adapter._format_chat_messages(list(CANONICAL_MESSAGES))
         
         # Verify the formatting
         assert "<s>[INST] <<SYS>>" in formatted
@@ -361,59 +339,114 @@ class TestOllamaAdapter:
         assert "How can I help?" in formatted
         assert "[INST] Tell me about NCA [/INST]" in formatted
     
-    async def test_embed(self, ollama_adapter, mock_session):
-        """Test the embed method."""
+    async def test_embed(self, ollama_adapter, respond, recorder):
+        """Test embedding a single text."""
         # Configure mock response
-        mock_response = MockResponse(status=200, data={
+        respond("POST", "/api/embeddings", payload={
             "embedding": [0.1, 0.2, 0.3, 0.4, 0.5]
         })
-        mock_session.post.return_value = mock_response
         
-        # Call the embed method with a single text
-        result = await ollama_adapter.embed("Test text")
+        # Call the embedding method with a single text
+        result = await ollama_adapter.generate_embedding("Test text")
         
         # Verify the correct API endpoint was called
-        mock_session.post.assert_called_with(
-            "http://localhost:11434/api/embeddings",
-            json={"model": "llama3", "prompt": "Test text"}
-        )
+        assert recorder.sent("POST", "/api/embeddings") == [
+            {"model": "llama3", "prompt": "Test text"}
+        ]
         
         # Verify the result
-        assert "embeddings" in result
-        assert result["embeddings"] == [0.1, 0.2, 0.3, 0.4, 0.5]
-        assert "usage" in result
-        assert result["metadata"]["embedding_size"] == 5
+        assert isinstance(result, LLMResponse)
+        assert result.response_type == ResponseType.EMBEDDING
+        assert result.content == [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert result.usage.prompt_tokens == 2
+        assert result.metadata["embedding_size"] == 5
     
-    async def test_embed_batch(self, ollama_adapter, mock_session):
-        """Test the embed method with a batch of texts."""
-        # Configure mock responses for multiple requests
-        mock_responses = [
-            MockResponse(status=200, data={"embedding": [0.1, 0.2, 0.3]}),
-            MockResponse(status=200, data={"embedding": [0.4, 0.5, 0.6]})
-        ]
-        mock_session.post.side_effect = mock_responses
-        
-        # Call the embed method with multiple texts
-        result = await ollama_adapter.embed(["Text 1", "Text 2"])
-        
-        # Verify the correct API endpoints were called
-        mock_session.post.assert_has_calls([
-            call("http://localhost:11434/api/embeddings", json={"model": "llama3", "prompt": "Text 1"}),
-            call("http://localhost:11434/api/embeddings", json={"model": "llama3", "prompt": "Text 2"})
-        ])
-        
-        # Verify the result contains both embeddings
-        assert "embeddings" in result
-        assert len(result["embeddings"]) == 2
-        assert result["embeddings"][0] == [0.1, 0.2, 0.3]
-        assert result["embeddings"][1] == [0.4, 0.5, 0.6]
+    async def test_embed_batch(self, ollama_adapter, respond, recorder):
+        """Test that a batch of texts is embedded concurrently."""
+        embeddings_by_prompt = {
+            "Text 1": [0.1, 0.2, 0.3],
+            "Text 2": [0.4, 0.5, 0.6],
+        }
+        in_flight = 0
+        all_in_flight = asyncio.Event()
+        
+        async def dispatch(url, json, **kwargs):
+            # Hold every request until the whole batch is in flight; a
+            # sequential implementation never gets past the first one.
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == len(embeddings_by_prompt):
+                all_in_flight.set()
+            await all_in_flight.wait()
+            return CallbackResult(payload={"embedding": embeddings_by_prompt[json["prompt"]]})
+        
+        respond("POST", "/api/embeddings", callback=dispatch, repeat=True)
+        
+        result = await asyncio.wait_for(
+            ollama_adapter.generate_embedding(list(embeddings_by_prompt)), timeout=1.0
+        )
+        
+        # Every prompt was sent once; completion order is not guaranteed
+        sent = recorder.sent("POST", "/api/embeddings")
+        assert len(sent) == len(embeddings_by_prompt)
+        assert {(body["model"], body["prompt"]) for body in sent} == {
+            ("llama3", prompt) for prompt in embeddings_by_prompt
+        }
+        
+        # Embeddings come back in input order
+        assert result.content == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        assert result.metadata["batch_size"] == 2
+    
+    async def test_embed_batch_concurrency_limit(self, basic_config, respond):
+        """Test that no more than max_concurrent_embeddings requests are in flight."""
+        in_flight = 0
+        peak = 0
+        
+        async def dispatch(url, json, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return CallbackResult(payload={"embedding": [float(json["prompt"])]})
+        
+        respond("POST", "/api/embeddings", callback=dispatch, repeat=True)
+        
+        adapter = OllamaAdapter({**basic_config, "max_concurrent_embeddings": 2})
+        try:
+            result = await adapter.generate_embedding([str(i) for i in range(6)])
+        finally:
+            await adapter.close()
+        
+        assert peak == 2
+        assert result.content == [[float(i)] for i in range(6)]
+    
+    async def test_embed_batch_error_cancels_pending(self, ollama_adapter, respond):
+        """Test that one failed request cancels the rest of the batch."""
+        cancelled = []
+        
+        async def dispatch(url, json, **kwargs):
+            if json["prompt"] == "bad":
+                return CallbackResult(status=500, body="Internal Server Error")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(json["prompt"])
+                raise
+        
+        respond("POST", "/api/embeddings", callback=dispatch, repeat=True)
+        
+        with pytest.raises(OllamaError):
+            await asyncio.wait_for(
+                ollama_adapter.generate_embedding(["slow 1", "bad", "slow 2"]), timeout=1.0
+            )
+        assert sorted(cancelled) == ["slow 1", "slow 2"]
     
-    async def test_embed_error(self, ollama_adapter, mock_session):
+    async def test_embed_error(self, ollama_adapter, respond):
         """Test error handling for embedding errors."""
         # Configure mock response for error
-        mock_response = MockResponse(status=500, text="Internal Server Error")
-        mock_session.post.return_value = mock_response
+        respond("POST", "/api/embeddings", status=500, body="Internal Server Error")
         
         # Call the method and expect an error
         with pytest.raises(OllamaError):
-            await ollama_adapter.embed("Test text")
+            await ollama_adapter.generate_embedding("Test text")
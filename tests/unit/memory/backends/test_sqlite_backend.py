@@ -7,18 +7,21 @@ import os
 import pytest
 import pytest_asyncio
 import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 from neuroca.memory.backends.factory.backend_type import BackendType
 from neuroca.memory.backends.factory.storage_factory import StorageBackendFactory
+from neuroca.memory.backends.sqlite import SQLiteBackend
 from neuroca.memory.models.memory_item import MemoryItem, MemoryContent, MemoryMetadata
 from neuroca.memory.models.search import MemorySearchOptions
 
 
-@pytest_asyncio.fixture
-async def memory_backend():
-    """Create a temporary in-memory backend for testing."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_memory_backend():
+    """Create one in-memory backend for the whole module."""
     # Create and initialize the backend using factory
     backend = StorageBackendFactory.create_storage(
         backend_type=BackendType.MEMORY
@@ -31,7 +34,204 @@ async def memory_backend():
     await backend.shutdown()
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture
+async def memory_backend(shared_memory_backend):
+    """Hand each test the shared in-memory backend and clear it afterwards."""
+    yield shared_memory_backend
+    await shared_memory_backend.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_sqlite_backend():
+    """Create one SQLite backend on a private in-memory database for the whole module."""
+    # Prefix the shared-cache name with the xdist worker so parallel runs stay isolated
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    backend = SQLiteBackend(
+        db_path=f"file:test_memory_{worker_id}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    )
+    await backend.initialize()
+    
+    yield backend
+    
+    await backend.shutdown()
+
+
+@pytest_asyncio.fixture
+async def sqlite_backend(shared_sqlite_backend):
+    """Hand each test the shared SQLite backend and empty its tables afterwards."""
+    yield shared_sqlite_backend
+    await shared_sqlite_backend.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def populated_sqlite_backend():
+    """Create a SQLite backend seeded once with a small read-only corpus for query tests."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    backend = SQLiteBackend(
+        db_path=f"file:test_corpus_{worker_id}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    )
+    await backend.initialize()
+    await backend.batch_store([
+        MemoryItem(
+            id="apple",
+            content=MemoryContent(text="Apple is a fruit"),
+            metadata=MemoryMetadata(importance=0.7, tags={"fruit": True})
+        ),
+        MemoryItem(
+            id="banana",
+            content=MemoryContent(text="Banana is yellow"),
+            metadata=MemoryMetadata(importance=0.5, tags={"fruit": True})
+        ),
+        MemoryItem(
+            id="car",
+            content=MemoryContent(text="Car is a vehicle"),
+            metadata=MemoryMetadata(importance=0.8, tags={"vehicle": True})
+        ),
+        MemoryItem(
+            id="quote",
+            content=MemoryContent(text='She said "quoted" words'),
+            metadata=MemoryMetadata(importance=0.2)
+        ),
+    ])
+    
+    yield backend
+    
+    await backend.shutdown()
+
+
+async def test_sqlite_pragmas_applied(sqlite_backend):
+    """Test that the configured PRAGMAs are applied to new connections."""
+    conn = sqlite_backend.connection.get_connection()
+    
+    # WAL is not available in memory, so journal_mode is left alone
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+async def test_sqlite_clear(sqlite_backend):
+    """Test that clearing empties every memory table but keeps the schema."""
+    def _insert():
+        conn = sqlite_backend.connection.get_connection()
+        conn.execute("INSERT INTO memory_items (id, content) VALUES ('a', 'text')")
+        conn.execute("INSERT INTO memory_metadata (memory_id, metadata_json) VALUES ('a', '{}')")
+        conn.execute("INSERT INTO memory_tags (memory_id, tag) VALUES ('a', 'tag')")
+    
+    await sqlite_backend.connection.execute_async(_insert)
+    assert await sqlite_backend.clear() is True
+    
+    conn = sqlite_backend.connection.get_connection()
+    for table in ("memory_items", "memory_metadata", "memory_tags"):
+        assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 0
+
+
+async def test_sqlite_batch_store_and_delete(sqlite_backend):
+    """Test that batch store writes items, metadata and tags, and batch delete removes them."""
+    memories = [
+        MemoryItem(
+            id=str(uuid.uuid4()),
+            content=MemoryContent(text=f"Batch content {i}"),
+            summary=f"Batch summary {i}",
+            metadata=MemoryMetadata(importance=0.5, tags={"batch": True})
+        ) for i in range(5)
+    ]
+    
+    memory_ids = await sqlite_backend.batch_store(memories)
+    assert memory_ids == [memory.id for memory in memories]
+    
+    retrieved = await sqlite_backend.retrieve(memory_ids[0])
+    assert retrieved.content.text == "Batch content 0"
+    assert retrieved.metadata.importance == 0.5
+    assert "batch" in retrieved.metadata.tags
+    
+    assert await sqlite_backend.batch_delete(memory_ids[:3]) == 3
+    
+    conn = sqlite_backend.connection.get_connection()
+    for table, column in (("memory_items", "id"), ("memory_metadata", "memory_id"), ("memory_tags", "memory_id")):
+        remaining = {row[0] for row in conn.execute(f"SELECT {column} FROM {table}")}
+        assert remaining == set(memory_ids[3:])
+
+
+@pytest.mark.parametrize("query,search_filter,expected", [
+    ("fruit", None, {"apple", "banana"}),  # matched through tags
+    ("yellow", None, {"banana"}),  # matched through content
+    ('"quoted"', None, {"quote"}),  # quotes are matched unescaped
+    ("fruit", MemorySearchOptions(min_importance=0.6), {"apple"}),
+    ("", MemorySearchOptions(min_importance=0.6), {"apple", "car"}),
+])
+async def test_sqlite_search(populated_sqlite_backend, query, search_filter, expected):
+    """Test that search() matches text first, then filters, and returns ranked results."""
+    results = await populated_sqlite_backend.search(query, search_filter)
+    
+    assert set(results.memory_ids) == expected
+    assert results.total_count == len(expected)
+    assert results.query == query
+    assert [result.rank for result in results.results] == list(range(1, len(expected) + 1))
+    assert {result.tier for result in results.results} == {"generic"}
+    if search_filter is not None:
+        assert results.options == search_filter
+    
+    # Later pages keep counting ranks from the offset
+    page = await populated_sqlite_backend.search(query, search_filter, limit=1, offset=1)
+    assert page.total_count == len(expected)
+    assert [result.rank for result in page.results] == ([2] if len(expected) > 1 else [])
+
+
+@pytest.mark.parametrize("query", ["text", "summary", "language", "en", "null", "{"])
+async def test_sqlite_search_ignores_stored_json(populated_sqlite_backend, query):
+    """Test that key names and syntax of the stored content JSON never match."""
+    results = await populated_sqlite_backend.search(query)
+    assert results.memory_ids == []
+    assert results.total_count == 0
+
+
+async def test_sqlite_search_hydrates_items(populated_sqlite_backend):
+    """Test that search results carry fully rebuilt memory items."""
+    results = await populated_sqlite_backend.search("apple")
+    
+    item = results.results[0].memory
+    assert item.content.text == "Apple is a fruit"
+    assert item.metadata.importance == 0.7
+
+
+async def test_sqlite_count(populated_sqlite_backend):
+    """Test counting with and without a filter."""
+    assert await populated_sqlite_backend.count() == 4
+    assert await populated_sqlite_backend.count(MemorySearchOptions(min_importance=0.6)) == 2
+
+
+async def test_sqlite_wal_on_disk(tmp_path):
+    """Test that file-backed databases are switched to WAL."""
+    backend = SQLiteBackend(db_path=str(tmp_path / "memory.db"))
+    await backend.initialize()
+    try:
+        conn = backend.connection.get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        await backend.shutdown()
+
+
+async def test_sqlite_in_memory_shared_across_threads():
+    """Test that the default in-memory database is visible from every executor thread."""
+    backend = SQLiteBackend(db_path=":memory:")
+    await backend.initialize()
+    try:
+        def _insert():
+            backend.connection.get_connection().execute(
+                "INSERT INTO memory_items (id, content) VALUES (?, ?)", ("shared", "text")
+            )
+        
+        await backend.connection.execute_async(_insert)
+        
+        # Read back on the calling thread's own connection
+        conn = backend.connection.get_connection()
+        assert conn.execute("SELECT content FROM memory_items WHERE id = 'shared'").fetchone()[0] == "text"
+    finally:
+        await backend.shutdown()
+
+
 async def test_store_and_retrieve(memory_backend):
     """Test storing and retrieving a memory item."""
     # Create test memory
@@ -53,12 +253,12 @@ async def test_store_and_retrieve(memory_backend):
     assert retrieved.id == memory_id
     assert retrieved.content.text == "Test content"
     assert retrieved.summary == "Test summary"
-    assert retrieved.metadata.importance == 0.8
-    assert "test" in retrieved.metadata.tags
-    assert "memory" in retrieved.metadata.tags
+    assert retrieved.metadata.model_dump(include={"importance", "tags"}) == {
+        "importance": 0.8,
+        "tags": {"test": True, "memory": True},
+    }
 
 
-@pytest.mark.asyncio
 async def test_update(memory_backend):
     """Test updating a memory item."""
     # Create and store test memory
@@ -85,11 +285,12 @@ async def test_update(memory_backend):
     retrieved = await memory_backend.retrieve(memory_id)
     assert retrieved.content.text == "Updated content"
     assert retrieved.summary == "Updated summary"
-    assert retrieved.metadata.importance == 0.7
-    assert "updated" in retrieved.metadata.tags
+    assert retrieved.metadata.model_dump(include={"importance", "tags"}) == {
+        "importance": 0.7,
+        "tags": {"updated": True},
+    }
 
 
-@pytest.mark.asyncio
 async def test_delete(memory_backend):
     """Test deleting a memory item."""
     # Create and store test memory
@@ -115,7 +316,6 @@ async def test_delete(memory_backend):
 
 
 @pytest.mark.skip("Search implementation varies across backends")
-@pytest.mark.asyncio
 async def test_search(memory_backend):
     """Test searching for memory items."""
     # Create and store test memories
@@ -140,8 +340,7 @@ async def test_search(memory_backend):
         )
     ]
     
-    for memory in memories:
-        await memory_backend.store(memory)
+    await memory_backend.batch_store(memories)
     
     # Test that we can use search method
     try:
@@ -153,7 +352,6 @@ async def test_search(memory_backend):
         pass
 
 
-@pytest.mark.asyncio
 async def test_batch_operations(memory_backend):
     """Test batch store and delete operations."""
     # Create test memories
@@ -170,28 +368,20 @@ async def test_batch_operations(memory_backend):
     assert len(memory_ids) == 5
     
     # Verify all memories were stored
-    for memory_id in memory_ids:
-        retrieved = await memory_backend.retrieve(memory_id)
-        assert retrieved is not None
+    retrieved = await asyncio.gather(*(memory_backend.retrieve(i) for i in memory_ids))
+    assert None not in retrieved
     
     # Test batch delete
     delete_results = await memory_backend.batch_delete(memory_ids[:3])
     assert all(delete_results.values())
     assert len(delete_results) == 3
     
-    # Verify memories were deleted
-    for memory_id in memory_ids[:3]:
-        retrieved = await memory_backend.retrieve(memory_id)
-        assert retrieved is None
-    
-    # Verify remaining memories still exist
-    for memory_id in memory_ids[3:]:
-        retrieved = await memory_backend.retrieve(memory_id)
-        assert retrieved is not None
+    # Verify only the deleted memories are gone
+    retrieved = await asyncio.gather(*(memory_backend.retrieve(i) for i in memory_ids))
+    assert [item is None for item in retrieved] == [True] * 3 + [False] * 2
 
 
 @pytest.mark.skip("Count implementation varies across backends")
-@pytest.mark.asyncio
 async def test_count(memory_backend):
     """Test counting memory items."""
     # Create and store test memories
@@ -213,8 +403,7 @@ async def test_count(memory_backend):
         )
     ]
     
-    for memory in memories:
-        await memory_backend.store(memory)
+    await memory_backend.batch_store(memories)
     
     # Test that we stored some memories
     try:
@@ -227,7 +416,6 @@ async def test_count(memory_backend):
 
 
 @pytest.mark.skip("Stats implementation varies across backends")
-@pytest.mark.asyncio
 async def test_get_stats(memory_backend):
     """Test getting storage statistics."""
     # Create and store test memories
@@ -249,8 +437,60 @@ async def test_get_stats(memory_backend):
         )
     ]
     
-    for memory in memories:
-        await memory_backend.store(memory)
+    await memory_backend.batch_store(memories)
     
     # Test that we have some stored memories
     assert memory_backend is not None
+
+
+async def test_sqlite_custom_executor():
+    """Test that database operations run on a caller-supplied executor."""
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-test") as executor:
+        backend = SQLiteBackend(db_path=":memory:", executor=executor)
+        await backend.initialize()
+        try:
+            thread_name = await backend.connection.execute_async(
+                lambda: threading.current_thread().name
+            )
+            assert thread_name.startswith("sqlite-test")
+        finally:
+            await backend.shutdown()
+
+
+async def test_sqlite_delete_then_restore_from_another_thread():
+    """Test that delete removes dependent rows so the same id can be stored again on any thread."""
+    db_path = f"file:test_delete_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    item = MemoryItem(
+        id="reused",
+        content=MemoryContent(text="First version"),
+        metadata=MemoryMetadata(importance=0.5, tags={"reused": True})
+    )
+    
+    with ThreadPoolExecutor(max_workers=1) as first, ThreadPoolExecutor(max_workers=1) as second:
+        # Delete on a connection without foreign key cascades
+        deleter = SQLiteBackend(
+            config={"sqlite": {"performance": {"foreign_keys": "OFF"}}},
+            db_path=db_path,
+            executor=first
+        )
+        await deleter.initialize()
+        # Store the same id again through a second backend on its own thread
+        restorer = SQLiteBackend(db_path=db_path, executor=second)
+        await restorer.initialize()
+        try:
+            await deleter.store(item)
+            assert await deleter.delete("reused") is True
+            
+            conn = deleter.connection.get_connection()
+            for table in ("memory_items", "memory_metadata", "memory_tags"):
+                assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 0
+            
+            item.content = MemoryContent(text="Second version")
+            await restorer.store(item)
+            
+            retrieved = await restorer.retrieve("reused")
+            assert retrieved.content.text == "Second version"
+            assert "reused" in retrieved.metadata.tags
+        finally:
+            await restorer.shutdown()
+            await deleter.shutdown()
@@ -0,0 +1,43 @@
+"""
+Unit tests for storage backend instance reuse in the factory.
+"""
+
+import pytest
+
+from neuroca.memory.backends.factory.backend_type import BackendType
+from neuroca.memory.backends.factory.storage_factory import StorageBackendFactory
+
+
+@pytest.fixture(autouse=True)
+def fresh_instances(monkeypatch):
+    """Give each test an empty instance registry."""
+    monkeypatch.setattr(StorageBackendFactory, "_instances", {})
+
+
+def test_different_configs_get_distinct_instances():
+    """Test that configs differing only in db_path are not shared."""
+    first = StorageBackendFactory.create_storage(
+        backend_type=BackendType.SQLITE, config={"db_path": "first.db"}
+    )
+    second = StorageBackendFactory.create_storage(
+        backend_type=BackendType.SQLITE, config={"db_path": "second.db"}
+    )
+
+    assert first is not second
+    assert len(StorageBackendFactory.get_existing_instances()) == 2
+
+
+def test_identical_configs_reuse_one_instance():
+    """Test that equal configs share an instance regardless of key order."""
+    config = {"db_path": "shared.db", "sqlite": {"connection": {"timeout_seconds": 5}, "schema": {}}}
+    reordered = {"sqlite": {"schema": {}, "connection": {"timeout_seconds": 5}}, "db_path": "shared.db"}
+
+    first = StorageBackendFactory.create_storage(backend_type=BackendType.SQLITE, config=config)
+    again = StorageBackendFactory.create_storage(backend_type=BackendType.SQLITE, config=dict(config))
+    reordered_instance = StorageBackendFactory.create_storage(
+        backend_type=BackendType.SQLITE, config=reordered
+    )
+
+    assert again is first
+    assert reordered_instance is first
+    assert len(StorageBackendFactory.get_existing_instances()) == 1
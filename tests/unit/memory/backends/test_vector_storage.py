@@ -0,0 +1,68 @@
+"""
+Unit tests for vector index persistence.
+"""
+
+import numpy as np
+import pytest
+
+from neuroca.memory.backends.vector.components.index import VectorIndex
+from neuroca.memory.backends.vector.components.models import VectorEntry
+from neuroca.memory.backends.vector.components.storage import VectorStorage
+from neuroca.memory.exceptions import StorageBackendError
+
+
+def _storage(tmp_path, vectors):
+    """Create a storage component over an index holding one entry per vector."""
+    index = VectorIndex(dimension=3)
+    index.batch_add([
+        VectorEntry(id=f"v{i}", vector=vector, metadata={"n": i})
+        for i, vector in enumerate(vectors)
+    ])
+    return VectorStorage(index, index_path=str(tmp_path / "index.json"))
+
+
+async def test_save_and_load_round_trip(tmp_path):
+    """Test that vectors and metadata survive a save/load cycle."""
+    storage = _storage(tmp_path, [[1.0, 0.0, 0.0], [0.0, 0.5, 0.5]])
+    storage.set_memory_metadata("v0", {"tier": "ltm"})
+    assert await storage.save() is True
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index.json", "index.npy"]
+
+    loaded = VectorStorage(VectorIndex(dimension=3), index_path=storage.index_path)
+    assert await loaded.load() is True
+
+    assert loaded.index.get("v1").vector == [0.0, 0.5, 0.5]
+    assert loaded.index.get("v1").metadata == {"n": 1}
+    assert loaded.get_memory_metadata("v0") == {"tier": "ltm"}
+
+
+async def test_failed_save_keeps_previous_files(tmp_path, monkeypatch):
+    """Test that a save failing midway leaves the last saved pair intact."""
+    storage = _storage(tmp_path, [[1.0, 0.0, 0.0]])
+    await storage.save()
+
+    storage.index.add(VectorEntry(id="v1", vector=[0.0, 1.0, 0.0]))
+
+    def _fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("neuroca.memory.backends.vector.components.storage.json.dump", _fail)
+    with pytest.raises(StorageBackendError):
+        await storage.save()
+    monkeypatch.undo()
+
+    # No temp files linger and the old pair still loads consistently
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index.json", "index.npy"]
+    loaded = VectorStorage(VectorIndex(dimension=3), index_path=storage.index_path)
+    await loaded.load()
+    assert loaded.index.get_entry_ids() == ["v0"]
+
+
+async def test_load_rejects_mismatched_vectors_file(tmp_path):
+    """Test that a vectors file out of step with the index is reported, not misaligned."""
+    storage = _storage(tmp_path, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    await storage.save()
+    np.save(storage.vectors_path, np.zeros((1, 3), dtype=np.float32))
+
+    with pytest.raises(StorageBackendError):
+        await VectorStorage(VectorIndex(dimension=3), index_path=storage.index_path).load()
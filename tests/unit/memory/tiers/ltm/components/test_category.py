@@ -154,7 +154,6 @@ class TestLTMCategory:
         # Should update lifecycle to remove memory
         category_manager._lifecycle.remove_memory.assert_called_once_with(memory_id)
     
-    @pytest.mark.asyncio
     async def test_add_to_category(self, category_manager, sample_memory_data):
         """
         Test adding a memory to a category.
@@ -189,7 +188,6 @@ class TestLTMCategory:
         # Verify lifecycle was updated
         category_manager._lifecycle.update_category.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_add_to_category_already_exists(self, category_manager, sample_memory_data):
         """
         Test adding a memory to a category it's already in.
@@ -219,7 +217,6 @@ class TestLTMCategory:
         # Verify update_func was NOT called since category already exists
         category_manager._update_func.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_get_memories_by_category(self, category_manager, sample_memory_data):
         """
         Test getting memories by category.
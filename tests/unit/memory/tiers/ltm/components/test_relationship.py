@@ -0,0 +1,109 @@
+"""
+Unit Tests for LTM Relationship Component
+
+This module contains unit tests for the LTMRelationship class which handles
+relationships between memories in the LTM tier.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from neuroca.memory.tiers.ltm.components.lifecycle import LTMLifecycle
+from neuroca.memory.tiers.ltm.components.relationship import LTMRelationship
+
+
+# a -> b -> c -> d, plus a shortcut a -> c
+EDGES = {"a": ["b", "c"], "b": ["c"], "c": ["d"]}
+MEMORY_IDS = {"a", "b", "c", "d"}
+
+
+def _memory_data(memory_id):
+    relationships = {related_id: {"type": "semantic", "strength": 0.5} for related_id in EDGES.get(memory_id, [])}
+    return {
+        "id": memory_id,
+        "content": {"text": f"Memory {memory_id}"},
+        "metadata": {"tags": {"relationships": relationships}},
+    }
+
+
+class TestLTMRelationship:
+    """
+    Test suite for LTMRelationship class.
+    """
+
+    @pytest.fixture
+    def backend(self):
+        """
+        Create a mocked backend serving the memories in EDGES.
+        """
+        backend = AsyncMock()
+        backend.retrieve.side_effect = lambda memory_id: _memory_data(memory_id) if memory_id in MEMORY_IDS else None
+        return backend
+
+    @pytest.fixture
+    def relationship_manager(self, backend):
+        """
+        Create an LTMRelationship whose lifecycle map holds the EDGES graph.
+        """
+        lifecycle = LTMLifecycle("ltm")
+        for memory_id, related_ids in EDGES.items():
+            for related_id in related_ids:
+                lifecycle.update_relationship(memory_id, related_id, 0.5)
+
+        relationship_manager = LTMRelationship("ltm")
+        relationship_manager.configure(
+            lifecycle=lifecycle,
+            backend=backend,
+            update_func=AsyncMock(),
+            config={}
+        )
+        return relationship_manager
+
+    async def test_find_path_uses_relationship_map(self, relationship_manager, backend):
+        """
+        Test that the shortest path is found and only its memories are read.
+        """
+        path = await relationship_manager.find_path("a", "d")
+
+        assert [memory["id"] for memory in path] == ["a", "c", "d"]
+        assert [call.args[0] for call in backend.retrieve.await_args_list] == ["a", "c", "d"]
+
+    async def test_find_path_respects_max_depth(self, relationship_manager):
+        """
+        Test that paths longer than max_depth are not returned.
+        """
+        assert await relationship_manager.find_path("b", "d", max_depth=2) is None
+
+        path = await relationship_manager.find_path("b", "d", max_depth=3)
+        assert [memory["id"] for memory in path] == ["b", "c", "d"]
+
+    async def test_find_path_without_lifecycle(self, backend):
+        """
+        Test that the backend walk is used when no lifecycle map is configured.
+        """
+        relationship_manager = LTMRelationship("ltm")
+        relationship_manager._backend = backend
+
+        path = await relationship_manager.find_path("a", "d")
+
+        assert [memory["id"] for memory in path] == ["a", "c", "d"]
+        assert await relationship_manager.find_path("d", "a") is None
+
+    async def test_remove_relationship_updates_map(self, relationship_manager):
+        """
+        Test that removing a relationship is reflected in later path searches.
+        """
+        await relationship_manager.remove_relationship("a", "c", bidirectional=False)
+
+        path = await relationship_manager.find_path("a", "d", max_depth=4)
+        assert [memory["id"] for memory in path] == ["a", "b", "c", "d"]
+
+    def test_remove_memory_cleans_both_directions(self, relationship_manager):
+        """
+        Test that removing a memory drops its own edges and edges pointing at it.
+        """
+        lifecycle = relationship_manager._lifecycle
+        lifecycle.remove_memory("c")
+
+        assert lifecycle.get_relationship_map() == {"a": {"b": 0.5}, "b": {}}
+        assert lifecycle.get_related_ids("c") == []